@@ -6,12 +6,14 @@ from ._qkeymap import (
     QKeyBindingSequence,
     qkey2modelkey,
     qkeycombo2modelkey,
+    qkeyint2modelint,
     qkeysequence2modelkeybinding,
     qmods2modelmods,
 )
 from ._qmainwindow import QModelMainWindow
 from ._qmenu import QModelMenu, QModelMenuBar, QModelSubmenu, QModelToolBar
-from ._util import to_qicon
+from ._qshortcuts import QModelShortcutDispatcher
+from ._util import clear_qicon_cache, to_qicon
 
 __all__ = [
     "QCommandAction",
@@ -22,10 +24,13 @@ __all__ = [
     "QModelMainWindow",
     "QModelMenu",
     "QModelMenuBar",
+    "QModelShortcutDispatcher",
     "QModelSubmenu",
     "QModelToolBar",
+    "clear_qicon_cache",
     "qkey2modelkey",
     "qkeycombo2modelkey",
+    "qkeyint2modelint",
     "qkeysequence2modelkeybinding",
     "qmods2modelmods",
     "to_qicon",
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import contextlib
 from typing import TYPE_CHECKING, ClassVar
-from weakref import WeakValueDictionary
+from weakref import WeakKeyDictionary, WeakSet, WeakValueDictionary
 
 from qtpy.QtGui import QKeySequence
 
@@ -10,7 +10,7 @@ from app_model import Application
 from app_model.expressions import Expr
 from app_model.types import ToggleRule
 
-from ._qkeymap import QKeyBindingSequence
+from ._qkeymap import keybinding_sequence
 from ._util import to_qicon
 
 if TYPE_CHECKING:
@@ -20,7 +20,8 @@ if TYPE_CHECKING:
     from qtpy.QtCore import QObject
     from typing_extensions import Self
 
-    from app_model.types import CommandRule, MenuItem
+    from app_model.registries import KeyBindingsRegistry
+    from app_model.types import CommandRule, KeyBinding, MenuItem
 else:
     from qtpy.QtWidgets import QAction
 
@@ -49,19 +50,33 @@ class QCommandAction(QAction):
         self._command_id = command_id
         self.setObjectName(command_id)
         self._keybinding_tooltip = ""
+        # the keybinding currently applied to the shortcut
+        self._keybinding: KeyBinding | None = None
         if kb := self._app.keybindings.get_keybinding(command_id):
-            self.setShortcut(QKeyBindingSequence(kb.keybinding))
-            self._keybinding_tooltip = f"({kb.keybinding.to_text()})"
+            self._set_keybinding(kb.keybinding)
+        _KeyBindingTracker.get(self._app).add(self)
         self.triggered.connect(self._on_triggered)
 
+    def _set_keybinding(self, keybinding: KeyBinding) -> None:
+        sequence, text = keybinding_sequence(keybinding)
+        self.setShortcut(sequence)
+        self._keybinding_tooltip = f"({text})"
+        self._keybinding = keybinding
+
     def _update_keybinding(self) -> None:
-        shortcut = self.shortcut()
-        if kb := self._app.keybindings.get_keybinding(self._command_id):
-            self.setShortcut(QKeyBindingSequence(kb.keybinding))
-            self._keybinding_tooltip = f"({kb.keybinding.to_text()})"
-        elif not shortcut.isEmpty():
+        kb = self._app.keybindings.get_keybinding(self._command_id)
+        self._apply_keybinding(kb.keybinding if kb else None)
+
+    def _apply_keybinding(self, keybinding: KeyBinding | None) -> None:
+        """Show `keybinding` (the command's resolved keybinding) as the shortcut."""
+        if keybinding is not None:
+            # skip (re)creating the same shortcut, e.g. on each menu rebuild
+            if keybinding is not self._keybinding:
+                self._set_keybinding(keybinding)
+        elif self._keybinding is not None or not self.shortcut().isEmpty():
             self.setShortcut(QKeySequence())
             self._keybinding_tooltip = ""
+            self._keybinding = None
 
     def _on_triggered(self, checked: bool) -> None:
         # execute_command returns a Future, for the sake of eventually being
@@ -105,6 +120,12 @@ class QCommandRuleAction(QCommandAction):
         self.setIconVisibleInMenu(command_rule.icon_visible_in_menu)
         if command_rule.status_tip:
             self.setStatusTip(command_rule.status_tip)
+        # names of the context keys used by the expressions of this action
+        self._context_names: set[str] = set()
+        if expr := command_rule.enablement:
+            self._context_names.update(expr._names)
+        if expr2 := _toggled_expr(command_rule):
+            self._context_names.update(expr2._names)
         if command_rule.toggled is not None:
             self.setCheckable(True)
             self._refresh()
@@ -115,19 +136,22 @@ class QCommandRuleAction(QCommandAction):
         super().setText(text)
         self._tooltip = self._tooltip or text or ""
 
-    def _update_keybinding(self) -> None:
-        super()._update_keybinding()
+    def _apply_keybinding(self, keybinding: KeyBinding | None) -> None:
+        super()._apply_keybinding(keybinding)
         tooltip_with_keybinding = f"{self._tooltip} {self._keybinding_tooltip}".rstrip()
         self.setToolTip(tooltip_with_keybinding)
 
     def update_from_context(self, ctx: Mapping[str, object]) -> None:
-        """Update the enabled state of this menu item from `ctx`."""
-        self.setEnabled(expr.eval(ctx) if (expr := self._cmd_rule.enablement) else True)
-        if expr2 := self._cmd_rule.toggled:
-            if isinstance(expr2, Expr) or (
-                isinstance(expr2, ToggleRule) and (expr2 := expr2.condition)
-            ):
-                self.setChecked(expr2.eval(ctx))
+        """Update the enabled state of this menu item from `ctx`.
+
+        Qt setters are only called for states that actually change.
+        """
+        enabled = bool(expr.eval(ctx)) if (expr := self._cmd_rule.enablement) else True
+        if enabled != self.isEnabled():
+            self.setEnabled(enabled)
+        if expr2 := _toggled_expr(self._cmd_rule):
+            if (checked := bool(expr2.eval(ctx))) != self.isChecked():
+                self.setChecked(checked)
 
     def _refresh(self) -> None:
         if isinstance(self._cmd_rule.toggled, ToggleRule):
@@ -164,6 +188,8 @@ class QMenuItemAction(QCommandRuleAction):
     ) -> None:
         super().__init__(menu_item.command, app, parent)
         self._menu_item = menu_item
+        if expr := menu_item.when:
+            self._context_names.update(expr._names)
         with contextlib.suppress(NameError):
             self.update_from_context(self._app.context)
 
@@ -193,7 +219,6 @@ class QMenuItemAction(QCommandRuleAction):
         cache_key = QMenuItemAction._cache_key(app, menu_item)
         if cache_key in cls._cache:
             res = cls._cache[cache_key]
-            res._update_keybinding()
             res.setParent(parent)
             return res
 
@@ -203,8 +228,70 @@ class QMenuItemAction(QCommandRuleAction):
     def update_from_context(self, ctx: Mapping[str, object]) -> None:
         """Update the enabled/visible state of this menu item from `ctx`."""
         super().update_from_context(ctx)
-        self.setVisible(expr.eval(ctx) if (expr := self._menu_item.when) else True)
+        visible = bool(expr.eval(ctx)) if (expr := self._menu_item.when) else True
+        if visible != self.isVisible():
+            self.setVisible(visible)
 
     def __repr__(self) -> str:
         name = self.__class__.__name__
         return f"{name}({self._menu_item!r}, app={self._app.name!r})"
+
+
+def _toggled_expr(command_rule: CommandRule) -> Expr | None:
+    """Return the expression controlling the checked state of `command_rule`."""
+    toggled = command_rule.toggled
+    if isinstance(toggled, ToggleRule):
+        return toggled.condition
+    return toggled if isinstance(toggled, Expr) else None
+
+
+class _KeyBindingTracker:
+    """Keeps the shortcuts of the `QCommandAction`s of an application up to date.
+
+    When keybindings are (un)registered, only the keybindings of the affected
+    commands are resolved, and applied to their actions.  Switching keymap
+    layers resolves the keybindings of all commands at once.
+    """
+
+    _instances: ClassVar[WeakKeyDictionary[Application, _KeyBindingTracker]] = (
+        WeakKeyDictionary()
+    )
+
+    def __init__(self, keybindings: KeyBindingsRegistry) -> None:
+        # no reference to the application, so that it can be garbage collected
+        self._keybindings = keybindings
+        self._actions: dict[str, WeakSet[QCommandAction]] = {}
+        keybindings.registered.connect(self._on_changed)
+        keybindings.unregistered.connect(self._on_changed)
+        keybindings.layers_changed.connect(self._on_layers_changed)
+
+    @classmethod
+    def get(cls, app: Application) -> _KeyBindingTracker:
+        if (tracker := cls._instances.get(app)) is None:
+            cls._instances[app] = tracker = cls(app.keybindings)
+        return tracker
+
+    def add(self, action: QCommandAction) -> None:
+        self._actions.setdefault(action._command_id, WeakSet()).add(action)
+
+    def _apply(self, command_id: str, keybinding: KeyBinding | None) -> None:
+        if not (actions := self._actions.get(command_id)):
+            self._actions.pop(command_id, None)
+            return
+        for action in list(actions):
+            try:
+                action._apply_keybinding(keybinding)
+            except RuntimeError:  # the underlying C++ object was deleted
+                actions.discard(action)
+
+    def _on_changed(self, command_ids: set[str]) -> None:
+        for command_id in command_ids:
+            if command_id in self._actions:
+                kb = self._keybindings.get_keybinding(command_id)
+                self._apply(command_id, kb.keybinding if kb else None)
+
+    def _on_layers_changed(self) -> None:
+        resolved = self._keybindings.get_command_keybindings()
+        for command_id in list(self._actions):
+            kb = resolved.get(command_id)
+            self._apply(command_id, kb.keybinding if kb else None)
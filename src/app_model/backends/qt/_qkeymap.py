@@ -3,9 +3,8 @@
 
 from __future__ import annotations
 
-import operator
-from functools import reduce
-from typing import TYPE_CHECKING
+from functools import cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from qtpy.QtCore import QCoreApplication, QKeyCombination, Qt
 from qtpy.QtGui import QKeySequence
@@ -53,13 +52,9 @@ def _mac_ctrl_meta_swapped() -> bool:
 
 def simple_keybinding_to_qint(skb: SimpleKeyBinding) -> int:
     """Create Qt Key integer from a SimpleKeyBinding."""
-    lookup = _SWAPPED_QMOD_LOOKUP if MAC and _mac_ctrl_meta_swapped() else _QMOD_LOOKUP
-    key = modelkey2qkey(skb.key) if skb.key else Qt.Key.Key_unknown
-    mods = (v for k, v in lookup.items() if getattr(skb, k))
-    combo = QKeyCombination(
-        reduce(operator.or_, mods, Qt.KeyboardModifier.NoModifier), key
-    )
-    return int(combo.toCombined())
+    tables = _current_key_tables()
+    code = skb._code
+    return tables.mods_to_qt[(code >> 8) & 0xF] | tables.keys_to_qt[code & 0xFF]
 
 
 # maybe ~ 1.5x faster than:
@@ -73,6 +68,28 @@ class QKeyBindingSequence(QKeySequence):
         super().__init__(*ints)
 
 
+# (KeyBinding int, OS, Ctrl/Meta swapped) -> (QKeySequence, text) of the keybinding
+_SEQUENCE_CACHE: dict[tuple[int, OperatingSystem, bool], tuple[QKeySequence, str]] = {}
+_SEQUENCE_CACHE_SIZE = 2048
+
+
+def keybinding_sequence(kb: KeyBinding) -> tuple[QKeySequence, str]:
+    """Return the QKeySequence and (`to_text`) text of `kb`.
+
+    Both are cached by keybinding, platform and Ctrl/Meta swap configuration, so
+    the returned QKeySequence may be shared and should not be modified.
+    """
+    if len(kb.parts) > 2:  # pragma: no cover
+        return QKeyBindingSequence(kb), kb.to_text()
+    os = OperatingSystem.current()
+    key = (kb.to_int(os), os, MAC and _mac_ctrl_meta_swapped())
+    if (cached := _SEQUENCE_CACHE.get(key)) is None:
+        if len(_SEQUENCE_CACHE) >= _SEQUENCE_CACHE_SIZE:
+            _SEQUENCE_CACHE.clear()
+        cached = _SEQUENCE_CACHE[key] = (QKeyBindingSequence(kb), kb.to_text())
+    return cached
+
+
 KEY_TO_QT: dict[KeyCode | None, Qt.Key] = {
     None: Qt.Key.Key_unknown,
     KeyCode.UNKNOWN: Qt.Key.Key_unknown,
@@ -233,16 +250,89 @@ _QTONLY_KEYS: Mapping[Qt.Key, KeyCode | KeyCombo] = {
 KEY_FROM_QT.update(_QTONLY_KEYS)
 
 
+# Qt.KeyboardModifier bits of Shift, Control, Alt and Meta (in that order)
+_QMODS_SHIFT = 25
+# bits of a combined Qt key int holding the Qt.Key (the rest are modifiers)
+_QKEY_MASK = 0x01FFFFFF
+
+
+def _qint(value: Any) -> int:
+    """Return the int value of a Qt enum/flag or QKeyCombination (Qt5 and Qt6)."""
+    if hasattr(value, "toCombined"):
+        return int(value.toCombined())
+    return int(getattr(value, "value", value))
+
+
+class _KeyTables(NamedTuple):
+    """Lookup tables for translating keys between Qt and app-model."""
+
+    # Qt modifier bits (`(qmods >> 25) & 0xF`) -> KeyMod int
+    mods_from_qt: tuple[int, ...]
+    # Qt key int (including Qt-only keys with implied modifiers) -> model int
+    keys_from_qt: dict[int, int]
+    # SimpleKeyBinding modifier bits (`(code >> 8) & 0xF`) -> Qt modifiers int
+    mods_to_qt: tuple[int, ...]
+    # KeyCode -> Qt key int
+    keys_to_qt: tuple[int, ...]
+
+
+@cache
+def _key_tables(mac_keymods: bool, swapped: bool) -> _KeyTables:
+    """Build the lookup tables for a platform and Ctrl/Meta swap configuration.
+
+    `mac_keymods` selects the macOS modifiers mapping (used when Qt does *not*
+    swap Ctrl and Meta), and `swapped` whether the Ctrl and Meta keys are swapped.
+    """
+    keymod_lookup = MAC_KEYMOD_FROM_QT if mac_keymods else KEYMOD_FROM_QT
+    qmods = (QSHIFT, QCTRL, QALT, QMETA)
+    mods_from_qt = tuple(
+        sum(int(keymod_lookup[m]) for n, m in enumerate(qmods) if i & (1 << n))
+        for i in range(16)
+    )
+
+    keys_from_qt = {_qint(k): int(v) for k, v in KEY_FROM_QT.items()}
+    keys_to_qt = [_qint(Qt.Key.Key_unknown)] * 256
+    for keycode, qkey in KEY_TO_QT.items():
+        if keycode:
+            keys_to_qt[keycode] = _qint(qkey)
+    if swapped:
+        keys_from_qt[_qint(Qt.Key.Key_Control)] = KeyCode.Meta
+        keys_from_qt[_qint(Qt.Key.Key_Meta)] = KeyCode.Ctrl
+        keys_to_qt[KeyCode.Meta] = _qint(Qt.Key.Key_Control)
+        keys_to_qt[KeyCode.Ctrl] = _qint(Qt.Key.Key_Meta)
+
+    qmod_lookup = _SWAPPED_QMOD_LOOKUP if swapped else _QMOD_LOOKUP
+    # same order as the SimpleKeyBinding modifier bits
+    skb_mods = [qmod_lookup[m] for m in ("ctrl", "shift", "alt", "meta")]
+    mods_to_qt = tuple(
+        sum(_qint(m) for n, m in enumerate(skb_mods) if i & (1 << n)) for i in range(16)
+    )
+    return _KeyTables(mods_from_qt, keys_from_qt, mods_to_qt, tuple(keys_to_qt))
+
+
+def _current_key_tables() -> _KeyTables:
+    if MAC:
+        swapped = _mac_ctrl_meta_swapped()
+        return _key_tables(not swapped, swapped)
+    return _key_tables(False, False)
+
+
+def qkeyint2modelint(qkey: int) -> int:
+    """Return the model key int (`KeyCombo`) of a combined Qt key int.
+
+    `qkey` is a Qt key combined with keyboard modifiers, e.g. as returned by
+    `QKeyCombination.toCombined()`.  This only uses precomputed lookup tables, so
+    it is suitable for translating key events.
+    """
+    tables = _current_key_tables()
+    mods = tables.mods_from_qt[(qkey >> _QMODS_SHIFT) & 0xF]
+    return mods | tables.keys_from_qt.get(qkey & _QKEY_MASK, KeyCode.UNKNOWN)
+
+
 def qmods2modelmods(modifiers: Qt.KeyboardModifier) -> KeyMod:
     """Return KeyMod from Qt.KeyboardModifier."""
-    mod = KeyMod.NONE
-    lookup = (
-        MAC_KEYMOD_FROM_QT if MAC and not _mac_ctrl_meta_swapped() else KEYMOD_FROM_QT
-    )
-    for modifier in lookup:
-        if modifiers & modifier:
-            mod |= lookup[modifier]
-    return mod
+    tables = _current_key_tables()
+    return KeyMod(tables.mods_from_qt[(_qint(modifiers) >> _QMODS_SHIFT) & 0xF])
 
 
 def modelkey2qkey(key: KeyCode) -> Qt.Key:
@@ -278,7 +368,7 @@ def qkeycombo2modelkey(key: QKeyCombination) -> KeyCode | KeyCombo:
 def qkeysequence2modelkeybinding(key: QKeySequence) -> KeyBinding:
     """Return KeyBinding from QKeySequence."""
     # FIXME: this should return KeyChord instead of KeyBinding... but that only takes 2
-    parts = [SimpleKeyBinding.from_int(qkeycombo2modelkey(x)) for x in iter(key)]
+    parts = [SimpleKeyBinding.from_int(qkeyint2modelint(_qint(x))) for x in iter(key)]
     return KeyBinding(parts=parts)
 
 
@@ -4,7 +4,8 @@ import contextlib
 from collections.abc import Collection, Iterable, Mapping, Sequence
 from typing import TYPE_CHECKING, cast
 
-from qtpy.QtWidgets import QApplication, QMenu, QMenuBar, QToolBar
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QAction, QApplication, QMenu, QMenuBar, QToolBar
 
 from app_model import Application
 from app_model.types import SubmenuItem
@@ -13,7 +14,8 @@ from ._qaction import QCommandRuleAction, QMenuItemAction
 from ._util import to_qicon
 
 if TYPE_CHECKING:
-    from qtpy.QtWidgets import QAction, QWidget
+    from qtpy.QtGui import QActionEvent
+    from qtpy.QtWidgets import QWidget
 
 
 class QModelMenu(QMenu):
@@ -29,16 +31,33 @@ class QModelMenu(QMenu):
         Optional title for the menu, by default None
     parent : QWidget | None
         Optional parent widget, by default None
+    follow_context : bool
+        If True, the state of the actions follows changes to the application's
+        context: only the actions whose expressions use a changed context key are
+        re-evaluated (including in submenus), so `update_from_context` does not
+        need to be called.  By default, False.
+    lazy_submenus : bool
+        If True, submenus are only populated when they are first shown (or
+        searched with `findAction`).  Note that Qt only activates the shortcuts
+        of actions in a submenu once it has been populated.  By default, False.
     """
 
+    # if True, the menu is only populated when it is first shown (or searched)
+    _lazy: bool = False
+
     def __init__(
         self,
         menu_id: str,
         app: Application | str,
         title: str | None = None,
         parent: QWidget | None = None,
+        *,
+        follow_context: bool = False,
+        lazy_submenus: bool = False,
     ) -> None:
         QMenu.__init__(self, parent)
+        # object name -> action, maintained in `actionEvent`
+        self._action_index: dict[str, QAction] = {}
 
         # NOTE: code duplication with QModelToolBar, but Qt mixins and multiple
         # inheritance are problematic for some versions of Qt, and for typing
@@ -46,7 +65,16 @@ class QModelMenu(QMenu):
         self._menu_id = menu_id
         self._app = Application.get_or_create(app) if isinstance(app, str) else app
         self.setObjectName(menu_id)
-        self.rebuild()
+        self._built = False
+        # last context passed to `update_from_context`, applied when (lazily) built
+        self._ctx: Mapping[str, object] | None = None
+        self._follow_context = follow_context
+        self._lazy_submenus = lazy_submenus
+        self._actions_by_name: dict[str, list[QCommandRuleAction]] = {}
+        if follow_context:
+            self._app.context.changed.connect(self._on_context_changed)
+        if not self._lazy:
+            self.rebuild()
         self._app.menus.menus_changed.connect(self._on_registry_changed)
         self.destroyed.connect(self._disconnect)
         # ----------------------
@@ -55,7 +83,9 @@ class QModelMenu(QMenu):
             self.setTitle(title)
         self.aboutToShow.connect(self._on_about_to_show)
 
-    def findAction(self, object_name: str) -> QAction | QModelMenu | None:
+    def findAction(
+        self, object_name: str, *, recursive: bool = False
+    ) -> QAction | QModelMenu | None:
         """Find an action by its ObjectName.
 
         Parameters
@@ -63,8 +93,25 @@ class QModelMenu(QMenu):
         object_name : str
             Action ID to find. Note that `QCommandAction` have `ObjectName` set
             to their `command.id`
+        recursive : bool
+            If True, also search the submenus of this menu (building them if they
+            have not been shown yet).  By default, False.
         """
-        return _find_action(self.actions(), object_name)
+        self._ensure_built()
+        if (action := self._action_index.get(object_name)) is not None:
+            return action
+        if recursive:
+            for action in self.actions():
+                if isinstance(sub := action.menu(), QModelMenu):
+                    if found := sub.findAction(object_name, recursive=True):
+                        return found
+        return None
+
+    def actionEvent(self, event: QActionEvent | None) -> None:
+        """Keep the index of actions by object name up to date."""
+        super().actionEvent(event)
+        if event is not None:
+            _update_action_index(self._action_index, self, event)
 
     def update_from_context(self, ctx: Mapping[str, object]) -> None:
         """Update the enabled/visible state of each menu item with `ctx`.
@@ -79,30 +126,50 @@ class QModelMenu(QMenu):
             *ALL variables used in these expressions must either be present in
             the `ctx` dict, or be builtins*.
         """
+        self._ctx = ctx
         _update_from_context(self.actions(), ctx)
 
     def rebuild(
         self, include_submenus: bool = True, exclude: Collection[str] | None = None
     ) -> None:
         """Rebuild menu by looking up self._menu_id in menu_registry."""
+        self._built = True
         _rebuild(
             menu=self,
             app=self._app,
             menu_id=self._menu_id,
             include_submenus=include_submenus,
             exclude=exclude,
+            follow_context=self._follow_context,
+            lazy_submenus=self._lazy_submenus,
         )
+        if self._follow_context:
+            self._actions_by_name = _index_context_names(self.actions())
+            _update_actions(self._actions_by_name, self._app.context)
+
+    def _ensure_built(self) -> None:
+        """Populate a lazy menu that has not been built yet."""
+        if not self._built:
+            self.rebuild()
+            if self._ctx is not None:
+                _update_from_context(self.actions(), self._ctx)
 
     def _on_about_to_show(self) -> None:
+        self._ensure_built()
         for action in self.actions():
             if isinstance(action, QCommandRuleAction):
                 action._refresh()
 
     def _disconnect(self) -> None:
         self._app.menus.menus_changed.disconnect(self._on_registry_changed)
+        self._app.context.changed.disconnect(self._on_context_changed)
+
+    def _on_context_changed(self, changed: set[str]) -> None:
+        _update_actions(self._actions_by_name, self._app.context, changed)
 
     def _on_registry_changed(self, changed_ids: set[str]) -> None:
-        if self._menu_id in changed_ids:
+        # lazy menus that have not been shown yet are built from scratch later
+        if self._built and self._menu_id in changed_ids:
             # if this (sub)menu has been removed from the registry,
             # we may hit a RuntimeError when trying to rebuild it.
             with contextlib.suppress(RuntimeError):
@@ -112,6 +179,10 @@ class QModelMenu(QMenu):
 class QModelSubmenu(QModelMenu):
     """QMenu for a menu_id in an `app_model` MenusRegistry.
 
+    If `lazy`, the actions of the submenu are only created when it is first about
+    to be shown (or when `findAction` is called), and are kept up to date from
+    then on.
+
     Parameters
     ----------
     submenu : SubmenuItem
@@ -120,6 +191,12 @@ class QModelSubmenu(QModelMenu):
         Application instance or name of application instance.
     parent : QWidget | None
         Optional parent widget, by default None
+    follow_context : bool
+        If True, the state of the submenu and its actions follows changes to the
+        application's context (see `QModelMenu`).  By default, False.
+    lazy : bool
+        If True, the submenu (and its own submenus) are only populated when first
+        shown.  Their shortcuts are inactive until then.  By default, False.
     """
 
     def __init__(
@@ -127,23 +204,46 @@ class QModelSubmenu(QModelMenu):
         submenu: SubmenuItem,
         app: Application | str,
         parent: QWidget | None = None,
+        *,
+        follow_context: bool = False,
+        lazy: bool = False,
     ) -> None:
         assert isinstance(submenu, SubmenuItem), f"Expected str, got {type(submenu)!r}"
         self._submenu = submenu
+        self._lazy = lazy
         super().__init__(
-            menu_id=submenu.submenu, app=app, title=submenu.title, parent=parent
+            menu_id=submenu.submenu,
+            app=app,
+            title=submenu.title,
+            parent=parent,
+            follow_context=follow_context,
+            lazy_submenus=lazy,
         )
         if submenu.icon:
             self.setIcon(to_qicon(submenu.icon))
+        if follow_context:
+            with contextlib.suppress(NameError):
+                self._update_enabled(self._app.context)
 
     def update_from_context(self, ctx: Mapping[str, object]) -> None:
         """Update the enabled state of this menu item from `ctx`."""
         super().update_from_context(ctx)
-        self.setEnabled(expr.eval(ctx) if (expr := self._submenu.enablement) else True)
+        self._update_enabled(ctx)
         # TODO: ... visibility needs to be controlled at the level of placement
         # in the submenu.  consider only using the `when` expression
         # self.setVisible(expr.eval(ctx) if (expr := self._submenu.when) else True)
 
+    def _update_enabled(self, ctx: Mapping[str, object]) -> None:
+        enabled = bool(expr.eval(ctx)) if (expr := self._submenu.enablement) else True
+        if enabled != self.isEnabled():
+            self.setEnabled(enabled)
+
+    def _on_context_changed(self, changed: set[str]) -> None:
+        super()._on_context_changed(changed)
+        if (expr := self._submenu.enablement) and not expr._names.isdisjoint(changed):
+            with contextlib.suppress(NameError):
+                self._update_enabled(self._app.context)
+
 
 class QModelToolBar(QToolBar):
     """QToolBar that is built from a list of model menu ids.
@@ -160,6 +260,9 @@ class QModelToolBar(QToolBar):
         Optional title for the menu, by default None
     parent : QWidget | None
         Optional parent widget, by default None
+    follow_context : bool
+        If True, the state of the actions follows changes to the application's
+        context (see `QModelMenu`).  By default, False.
     """
 
     def __init__(
@@ -170,9 +273,12 @@ class QModelToolBar(QToolBar):
         exclude: Collection[str] | None = None,
         title: str | None = None,
         parent: QWidget | None = None,
+        follow_context: bool = False,
     ) -> None:
         self._exclude = exclude
         QToolBar.__init__(self, parent)
+        # object name -> action, maintained in `actionEvent`
+        self._action_index: dict[str, QAction] = {}
 
         # NOTE: code duplication with QModelMenu, but Qt mixins and multiple
         # inheritance are problematic for some versions of Qt, and for typing
@@ -180,6 +286,10 @@ class QModelToolBar(QToolBar):
         self._menu_id = menu_id
         self._app = Application.get_or_create(app) if isinstance(app, str) else app
         self.setObjectName(menu_id)
+        self._follow_context = follow_context
+        self._actions_by_name: dict[str, list[QCommandRuleAction]] = {}
+        if follow_context:
+            self._app.context.changed.connect(self._on_context_changed)
         self.rebuild()
         self._app.menus.menus_changed.connect(self._on_registry_changed)
         self.destroyed.connect(self._disconnect)
@@ -200,7 +310,13 @@ class QModelToolBar(QToolBar):
             Action ID to find. Note that `QCommandAction` have `ObjectName` set
             to their `command.id`
         """
-        return _find_action(self.actions(), object_name)
+        return self._action_index.get(object_name)
+
+    def actionEvent(self, event: QActionEvent | None) -> None:
+        """Keep the index of actions by object name up to date."""
+        super().actionEvent(event)
+        if event is not None:
+            _update_action_index(self._action_index, self, event)
 
     def update_from_context(self, ctx: Mapping[str, object]) -> None:
         """Update the enabled/visible state of each menu item with `ctx`.
@@ -227,10 +343,18 @@ class QModelToolBar(QToolBar):
             menu_id=self._menu_id,
             include_submenus=include_submenus,
             exclude=self._exclude if exclude is None else exclude,
+            follow_context=self._follow_context,
         )
+        if self._follow_context:
+            self._actions_by_name = _index_context_names(self.actions())
+            _update_actions(self._actions_by_name, self._app.context)
 
     def _disconnect(self) -> None:
         self._app.menus.menus_changed.disconnect(self._on_registry_changed)
+        self._app.context.changed.disconnect(self._on_context_changed)
+
+    def _on_context_changed(self, changed: set[str]) -> None:
+        _update_actions(self._actions_by_name, self._app.context, changed)
 
     def _on_registry_changed(self, changed_ids: set[str]) -> None:
         if self._menu_id in changed_ids:
@@ -248,6 +372,12 @@ class QModelMenuBar(QMenuBar):
         Application instance or name of application instance.
     parent : QWidget | None
         Optional parent widget, by default None
+    follow_context : bool
+        If True, the state of the actions in all menus follows changes to the
+        application's context (see `QModelMenu`).  By default, False.
+    lazy_submenus : bool
+        If True, submenus are only populated when first shown (see `QModelMenu`).
+        By default, False.
     """
 
     def __init__(
@@ -255,13 +385,39 @@ class QModelMenuBar(QMenuBar):
         menus: Mapping[str, str] | Sequence[str | tuple[str, str]],
         app: Application | str,
         parent: QWidget | None = None,
+        *,
+        follow_context: bool = False,
+        lazy_submenus: bool = False,
     ) -> None:
         super().__init__(parent)
 
         menu_items = menus.items() if isinstance(menus, Mapping) else menus
         for item in menu_items:
             id_, title = item if isinstance(item, tuple) else (item, item.title())
-            self.addMenu(QModelMenu(id_, app, title, self))
+            menu = QModelMenu(
+                id_,
+                app,
+                title,
+                self,
+                follow_context=follow_context,
+                lazy_submenus=lazy_submenus,
+            )
+            self.addMenu(menu)
+
+    def findAction(self, object_name: str) -> QAction | QModelMenu | None:
+        """Find an action by its ObjectName, in all menus (and their submenus).
+
+        Parameters
+        ----------
+        object_name : str
+            Action ID to find. Note that `QCommandAction` have `ObjectName` set
+            to their `command.id`
+        """
+        for action in self.actions():
+            if isinstance(menu := action.menu(), QModelMenu):
+                if found := menu.findAction(object_name, recursive=True):
+                    return found
+        return None
 
     def update_from_context(self, ctx: Mapping[str, object]) -> None:
         """Update the enabled/visible state of each menu item with `ctx`.
@@ -285,31 +441,74 @@ def _rebuild(
     menu_id: str,
     include_submenus: bool = True,
     exclude: Collection[str] | None = None,
+    follow_context: bool = False,
+    lazy_submenus: bool = False,
 ) -> None:
-    """Rebuild menu by looking up `menu` in `Application`'s menu_registry."""
-    actions = menu.actions()
-    for action in actions:
-        menu.removeAction(action)
+    """Rebuild menu by looking up `menu` in `Application`'s menu_registry.
 
-    _exclude = exclude or set()
+    Rather than clearing the menu, the current actions are diffed against the new
+    layout: actions and submenus that are still present are kept (and moved if
+    needed), separators are reused, and only new items are created.
+    """
+    current = menu.actions()
+    submenus: dict[SubmenuItem, QModelSubmenu] = {}
+    separators: list[QAction] = []
+    for action in current:
+        if isinstance(sub := action.menu(), QModelSubmenu):
+            submenus[sub._submenu] = sub
+        elif action.isSeparator():
+            separators.append(action)
+    separators.reverse()  # reuse from the top
 
+    _exclude = exclude or set()
     groups = list(app.menus.iter_menu_groups(menu_id))
     n_groups = len(groups)
     qapp = QApplication.instance()
+    layout: list[QAction] = []
     for n, group in enumerate(groups):
         for item in group:
             if isinstance(item, SubmenuItem):
-                if include_submenus:
-                    submenu = QModelSubmenu(item, app, parent=menu)
-                    cast("QMenu", menu).addMenu(submenu)
+                # QToolBar cannot show submenus
+                if include_submenus and isinstance(menu, QMenu):
+                    if (submenu := submenus.pop(item, None)) is None:
+                        submenu = QModelSubmenu(
+                            item,
+                            app,
+                            parent=menu,
+                            follow_context=follow_context,
+                            lazy=lazy_submenus,
+                        )
+                    layout.append(cast("QAction", submenu.menuAction()))
             elif item.command.id not in _exclude:
                 # use QApplication instance as parent for actions
                 # because we use action singleton, and actions
                 # are not related to any window.
-                action = QMenuItemAction.create(item, app=app, parent=qapp)
-                menu.addAction(action)
+                layout.append(QMenuItemAction.create(item, app=app, parent=qapp))
         if n < n_groups - 1:
-            menu.addSeparator()
+            if separators:
+                layout.append(separators.pop())
+            else:
+                sep = QAction(menu)
+                sep.setSeparator(True)
+                layout.append(sep)
+
+    keep = set(map(id, layout))
+    for action in current:
+        if id(action) not in keep:
+            menu.removeAction(action)
+    for submenu in submenus.values():
+        # submenus that are no longer placed in this menu
+        submenu._disconnect()
+        submenu.deleteLater()
+
+    actual = [a for a in current if id(a) in keep]
+    for i, action in enumerate(layout):
+        if i < len(actual) and actual[i] is action:
+            continue
+        menu.insertAction(actual[i] if i < len(actual) else None, action)
+        if action in actual:
+            actual.remove(action)
+        actual.insert(i, action)
 
 
 def _update_from_context(actions: Iterable[QAction], ctx: Mapping[str, object]) -> None:
@@ -337,5 +536,44 @@ def _update_from_context(actions: Iterable[QAction], ctx: Mapping[str, object])
         raise AttributeError(f"This version of Qt is not supported: {e}") from e
 
 
-def _find_action(actions: Iterable[QAction], object_name: str) -> QAction | None:
-    return next((a for a in actions if a.objectName() == object_name), None)
+def _index_context_names(
+    actions: Iterable[QAction],
+) -> dict[str, list[QCommandRuleAction]]:
+    """Return the actions using each context key in their expressions."""
+    index: dict[str, list[QCommandRuleAction]] = {}
+    for action in actions:
+        if isinstance(action, QCommandRuleAction):
+            for name in action._context_names:
+                index.setdefault(name, []).append(action)
+    return index
+
+
+def _update_actions(
+    actions_by_name: Mapping[str, list[QCommandRuleAction]],
+    ctx: Mapping[str, object],
+    changed: Iterable[str] | None = None,
+) -> None:
+    """Update the actions using any of the `changed` context keys (default all)."""
+    names = actions_by_name if changed is None else changed
+    dirty = dict.fromkeys(a for n in names for a in actions_by_name.get(n, ()))
+    for action in dirty:
+        # as for new actions, skip those whose expressions use missing keys
+        with contextlib.suppress(NameError):
+            action.update_from_context(ctx)
+
+
+def _update_action_index(
+    index: dict[str, QAction], widget: QWidget, event: QActionEvent
+) -> None:
+    """Update `index` of the actions of `widget` after an action `event`."""
+    if (action := event.action()) is None or not (name := action.objectName()):
+        return
+    if event.type() == QEvent.Type.ActionAdded:
+        index.setdefault(name, action)
+    elif event.type() == QEvent.Type.ActionRemoved and index.get(name) is action:
+        del index[name]
+        # another action with the same name may remain
+        for other in widget.actions():
+            if other is not action and other.objectName() == name:
+                index[name] = other
+                break
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, cast
+
+from qtpy.QtCore import QEvent, QObject, Qt
+from qtpy.QtWidgets import QApplication, QWidget
+
+from app_model import Application
+from app_model.registries import KeyBindingDispatcher
+
+from ._qkeymap import _qint, qkeyint2modelint
+
+if TYPE_CHECKING:
+    from qtpy.QtGui import QKeyEvent
+
+logger = logging.getLogger(__name__)
+
+
+class QModelShortcutDispatcher(QObject):
+    """Application-wide dispatcher of the keybindings of an `Application`.
+
+    Once installed (with `install`), key presses anywhere in the QApplication are
+    resolved with the application's `KeyBindingsRegistry`: the `when` clause of
+    keybindings is evaluated in `Application.context`, chords are supported, and
+    the resulting command is executed with the application's `CommandsRegistry`.
+    This means that shortcuts work whether or not a `QAction` for the command
+    has been placed in a visible widget.
+
+    Key presses are intercepted as `QEvent.ShortcutOverride` events, which Qt
+    sends before resolving its own shortcuts.  Keys bound in the registry are
+    thus never handled by `QAction` shortcuts; if no keybinding for a key is
+    enabled in the context, the key press is delivered to the focus widget.
+
+    Parameters
+    ----------
+    app : Application | str
+        Application instance or name of application instance.
+    parent : QObject | None
+        Optional parent object, by default None
+    chord_timeout : float | None
+        Seconds after which a pending chord is abandoned, by default 5.
+    """
+
+    def __init__(
+        self,
+        app: Application | str,
+        parent: QObject | None = None,
+        *,
+        chord_timeout: float | None = 5,
+    ) -> None:
+        super().__init__(parent)
+        self._app = Application.get_or_create(app) if isinstance(app, str) else app
+        self._dispatcher = KeyBindingDispatcher(self._app.keybindings, chord_timeout)
+        # (key, modifiers) of a key press to swallow, after its shortcut override
+        self._swallow: tuple[int, Qt.KeyboardModifier] | None = None
+        # (key, modifiers, timestamp) of an unhandled shortcut override, and the
+        # widget it propagates to next (so that it is only dispatched once)
+        self._propagating: tuple[tuple, QWidget | None] | None = None
+
+    def install(self) -> None:
+        """Start dispatching key presses of the QApplication."""
+        if (qapp := QApplication.instance()) is not None:
+            qapp.installEventFilter(self)
+
+    def uninstall(self) -> None:
+        """Stop dispatching key presses, and abandon any pending chord."""
+        if (qapp := QApplication.instance()) is not None:
+            qapp.removeEventFilter(self)
+        self._dispatcher.reset()
+
+    @property
+    def pending(self) -> int | None:
+        """The first part of the chord being entered, if any."""
+        return self._dispatcher.pending
+
+    def eventFilter(self, obj: QObject | None, event: QEvent | None) -> bool:
+        """Dispatch shortcut overrides, and swallow the key presses they handled."""
+        if event is None:  # pragma: no cover
+            return False
+        if event.type() == QEvent.Type.KeyPress and self._swallow is not None:
+            key_event = cast("QKeyEvent", event)
+            swallow = self._swallow == (key_event.key(), key_event.modifiers())
+            self._swallow = None
+            return swallow
+        if event.type() == QEvent.Type.ShortcutOverride:
+            return self._on_shortcut_override(obj, cast("QKeyEvent", event))
+        return False
+
+    def _on_shortcut_override(self, obj: QObject | None, event: QKeyEvent) -> bool:
+        sig = (event.key(), event.modifiers(), event.timestamp())
+        if (prop := self._propagating) is not None and prop[0] == sig:
+            if (widget := prop[1]) is not None and obj is widget:
+                # the same (unhandled) event, propagating to a parent widget
+                self._propagating = (sig, widget.parentWidget())
+                return False
+        self._propagating = None
+
+        key = qkeyint2modelint(event.key() | _qint(event.modifiers()))
+        registry = self._app.keybindings
+        was_pending = self._dispatcher.pending is not None
+        result = self._dispatcher.dispatch(key, self._app.context)
+        if result is None and not was_pending:
+            if registry.is_bound(key) or registry.is_chord_prefix(key):
+                # bound, but not enabled in this context: prevent QAction shortcuts
+                # from firing, and let the focus widget handle the key press.
+                event.accept()
+                return True
+            parent = obj.parentWidget() if isinstance(obj, QWidget) else None
+            self._propagating = (sig, parent)
+            return False
+
+        # handled (or part of a chord): make Qt deliver it as a key press instead
+        # of a shortcut, and swallow that key press.
+        event.accept()
+        self._swallow = (event.key(), event.modifiers())
+        if (command_id := getattr(result, "command_id", None)) is not None:
+            try:
+                self._app.commands.execute_command(command_id).result()
+            except Exception:
+                # don't raise into Qt's event dispatch: the key was still handled
+                logger.exception("Error executing command %r", command_id)
+        return True
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from qtpy.QtCore import QUrl
@@ -12,14 +13,29 @@ if TYPE_CHECKING:
 
 
 def to_qicon(icon: Icon, theme: Literal["dark", "light"] = "dark") -> QIcon:
-    """Create QIcon from Icon."""
-    from superqt import QIconifyIcon, fonticon
+    """Create QIcon from Icon.
 
+    QIcons are cached by icon key and theme, so the returned QIcon may be shared
+    with other callers and should not be modified.  Call `clear_qicon_cache` when
+    the icons need to be recreated (e.g. after switching the application theme).
+    """
     if icn := getattr(icon, theme, ""):
-        if icn.startswith("file://"):
-            return QIcon(QUrl(icn).toLocalFile())
-        elif ":" in icn:
-            return QIconifyIcon(icn)
-        else:
-            return fonticon.icon(icn)
+        return _qicon_for_key(icn, theme)
     return QIcon()  # pragma: no cover
+
+
+def clear_qicon_cache() -> None:
+    """Clear the QIcons cached by `to_qicon`."""
+    _qicon_for_key.cache_clear()
+
+
+@lru_cache(maxsize=512)
+def _qicon_for_key(key: str, theme: str) -> QIcon:
+    from superqt import QIconifyIcon, fonticon
+
+    if key.startswith("file://"):
+        return QIcon(QUrl(key).toLocalFile())
+    elif ":" in key:
+        return QIconifyIcon(key)
+    else:
+        return fonticon.icon(key)
@@ -4,13 +4,14 @@ import os
 import sys
 from collections import ChainMap
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any
+from functools import partial
+from typing import TYPE_CHECKING, Any, NamedTuple
 from weakref import finalize
 
 from psygnal import Signal
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator, MutableMapping
+    from collections.abc import Callable, Iterable, Iterator, MutableMapping
     from types import FrameType
     from typing import TypedDict
 
@@ -25,16 +26,190 @@ if TYPE_CHECKING:
 _null = object()
 
 
+class _Computed:
+    """Placeholder for a context value that is computed when first read."""
+
+    __slots__ = ("getter",)
+
+    def __init__(self, getter: Callable[[], Any]) -> None:
+        self.getter = getter
+
+
+class _DerivedKey(NamedTuple):
+    """A context key computed from other keys."""
+
+    getter: Callable[..., Any]
+    depends_on: tuple[str, ...]
+    lazy: bool
+
+
+def _differs(old: Any, new: Any) -> bool:
+    if old is new:
+        return False
+    try:
+        return bool(old != new)
+    except Exception:  # e.g. ambiguous truth value of an array
+        return True
+
+
 class Context(ChainMap):
-    """Evented Mapping of keys to values."""
+    """Evented Mapping of keys to values.
+
+    Keys may also be *derived* from other keys (see `add_derived`).  Derived keys
+    form a dependency graph: when a key changes, only the derived keys downstream
+    of it are updated (in topological order), and a single `changed` event is
+    emitted with the names of all keys that changed.
+    """
 
     changed = Signal(set)  # Set[str]
 
     def __init__(self, *maps: MutableMapping) -> None:
         super().__init__(*maps)
+        self._derived: dict[str, _DerivedKey] = {}
+        self._dependents: dict[str, set[str]] = {}  # key -> derived keys using it
+        self._rank: dict[str, int] = {}  # topological order of derived keys
         for m in maps:
             if isinstance(m, Context):
-                m.changed.connect(self.changed)
+                m.changed.connect(self._on_parent_changed)
+
+    def add_derived(
+        self,
+        key: str,
+        getter: Callable[..., Any],
+        depends_on: Iterable[str] = (),
+        *,
+        lazy: bool = False,
+    ) -> Callable[[], None]:
+        """Declare `key` as derived from the keys in `depends_on`.
+
+        Parameters
+        ----------
+        key : str
+            Name of the derived key.
+        getter : Callable[..., Any]
+            Function that computes the value of `key`.  It is called with the
+            current values of the `depends_on` keys as positional arguments (`None`
+            for missing keys).
+        depends_on : Iterable[str]
+            Names of the keys (plain or derived) that `key` is computed from.
+        lazy : bool
+            If `True`, `key` is not recomputed when its dependencies change; it is
+            marked out-of-date (and reported as changed) and computed on the next
+            read.  If `False` (the default), `key` is recomputed immediately, and
+            reported as changed only if its value actually changed.
+
+        Returns
+        -------
+        Callable[[], None]
+            A function that stops deriving `key` (its last value is kept).
+
+        Raises
+        ------
+        ValueError
+            If `key` is already derived, or if the new key would create a cycle.
+        """
+        if key in self._derived:
+            raise ValueError(f"Context key {key!r} is already derived")
+        node = _DerivedKey(getter, tuple(depends_on), lazy)
+        self._derived[key] = node
+        try:
+            self._rank = self._sort_derived()
+        except ValueError:
+            del self._derived[key]
+            raise
+        for dep in node.depends_on:
+            self._dependents.setdefault(dep, set()).add(key)
+        self._emit(set(), (key,))
+
+        def _dispose() -> None:
+            if key not in self._derived:
+                return
+            # the last value is kept as a plain key
+            if type(self.maps[0].get(key)) is _Computed:
+                self.maps[0][key] = self._compute(key)
+            del self._derived[key]
+            for dep in node.depends_on:
+                self._dependents[dep].discard(key)
+            self._rank = self._sort_derived()
+
+        return _dispose
+
+    def invalidate(self, *keys: str) -> None:
+        """Recompute derived `keys` (by default, all), and everything downstream.
+
+        This is useful for derived keys whose getters depend on state outside of
+        this context.
+        """
+        for key in keys:
+            if key not in self._derived:
+                raise KeyError(f"{key!r} is not a derived context key")
+        self._emit(set(), keys or tuple(self._derived))
+
+    def _sort_derived(self) -> dict[str, int]:
+        """Return the topological rank of each derived key."""
+        rank: dict[str, int] = {}
+        visiting: set[str] = set()
+
+        def _visit(key: str) -> None:
+            if key in rank:
+                return
+            if key in visiting:
+                raise ValueError(f"Circular dependency in derived context key {key!r}")
+            visiting.add(key)
+            for dep in self._derived[key].depends_on:
+                if dep in self._derived:
+                    _visit(dep)
+            visiting.discard(key)
+            rank[key] = len(rank)
+
+        for key in self._derived:
+            _visit(key)
+        return rank
+
+    def _compute(self, key: str) -> Any:
+        node = self._derived[key]
+        return node.getter(*(self.get(dep) for dep in node.depends_on))
+
+    def _update_derived(self, changed: set[str], invalid: Iterable[str]) -> set[str]:
+        """Update derived keys downstream of `changed` and `invalid` keys.
+
+        Returns the names of all keys that changed.
+        """
+        invalid = set(invalid)
+        affected = set(invalid)
+        stack = [*changed, *invalid]
+        while stack:
+            for key in self._dependents.get(stack.pop(), ()):
+                if key not in affected:
+                    affected.add(key)
+                    stack.append(key)
+        if not affected:
+            return changed
+
+        own = self.maps[0]
+        for key in sorted(affected, key=self._rank.__getitem__):
+            node = self._derived[key]
+            if key not in invalid and changed.isdisjoint(node.depends_on):
+                continue  # none of its inputs actually changed
+            current = own.get(key, _null)
+            if type(current) is _Computed:
+                continue  # not read since it was last marked out-of-date
+            if node.lazy:
+                own[key] = _Computed(partial(self._compute, key))
+                changed.add(key)
+            elif _differs(current, value := self._compute(key)):
+                own[key] = value
+                changed.add(key)
+        return changed
+
+    def _emit(self, changed: set[str], invalid: Iterable[str] = ()) -> None:
+        if self._derived:
+            changed = self._update_derived(changed, invalid)
+        if changed:
+            self.changed.emit(changed)
+
+    def _on_parent_changed(self, changed: set[str]) -> None:
+        self._emit(set(changed))
 
     @contextmanager
     def buffered_changes(self) -> Iterator[None]:
@@ -42,22 +217,35 @@ class Context(ChainMap):
         with self.changed.paused(lambda a, b: (a[0].union(b[0]),)):
             yield
 
+    def __getitem__(self, k: str) -> Any:
+        v = super().__getitem__(k)
+        if type(v) is _Computed:
+            v = v.getter()
+            # replace the placeholder with the result.  No event is emitted here:
+            # the change was already announced when the placeholder was set.
+            for m in self.maps:
+                if k in m:
+                    if not isinstance(m, Context):  # nested contexts cache their own
+                        m[k] = v
+                    break
+        return v
+
     def __setitem__(self, k: str, v: Any) -> None:
         emit = self.get(k, _null) is not v
         super().__setitem__(k, v)
         if emit:
-            self.changed.emit({k})
+            self._emit({k})
 
     def __delitem__(self, k: str) -> None:
         emit = k in self
         super().__delitem__(k)
         if emit:
-            self.changed.emit({k})
+            self._emit({k})
 
     def new_child(self, m: MutableMapping | None = None) -> Context:
         """Create a new child context from this one."""
         new = super().new_child(m=m)
-        self.changed.connect(new.changed)
+        self.changed.connect(new._on_parent_changed)
         return new
 
     def __hash__(self) -> int:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+from functools import partial
 from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
@@ -13,11 +14,14 @@ from typing import (
     overload,
 )
 
+from ._context import Context
 from ._expressions import Name
 
 if TYPE_CHECKING:
     import builtins
-    from collections.abc import Callable, MutableMapping
+    from collections.abc import Callable, Iterable, MutableMapping
+
+    from psygnal import SignalInstance
 
 T = TypeVar("T")
 A = TypeVar("A")
@@ -68,6 +72,13 @@ class ContextKey(Name, Generic[A, T]):
         Explicitly provide the `Name` string used when evaluating a context,
         by default the key will be taken as the attribute name to which this
         object is assigned as a class attribute:
+    depends_on : Iterable[str | ContextKey], optional
+        If provided (along with `getter`), this key is *computed*: a
+        `ContextNamespace` created with a `source` object will call `getter(source)`
+        lazily, the first time the key is read, and cache the result in the context
+        until one of the keys in `depends_on` changes (or the namespace is otherwise
+        invalidated, see `ContextNamespace.watch`).  Use an empty sequence for keys
+        that depend only on the source object.  By default None (not computed).
 
     Examples
     --------
@@ -80,6 +91,14 @@ class ContextKey(Name, Generic[A, T]):
 
     >>> expr.eval({"some_key": 3})  # False
     >>> expr.eval({"some_key": 6})  # True
+
+    computed keys are evaluated on demand, and cached until a dependency changes
+
+    >>> class LayerKeys(ContextNamespace):
+    ...     n_selected = ContextKey(0, "number selected", len, depends_on=())
+    ...     any_selected = ContextKey(
+    ...         False, "any selected", bool, depends_on=[n_selected]
+    ...     )
     """
 
     # This will catalog all ContextKeys that get instantiated, which provides
@@ -95,11 +114,15 @@ class ContextKey(Name, Generic[A, T]):
         getter: Callable[[A], T] | None = None,
         *,
         id: str = "",  # optional because of __set_name__
+        depends_on: Iterable[str | ContextKey] | None = None,
     ) -> None:
         bound = type(default_value) if default_value is not MISSING else None
         super().__init__(id or "", bound=bound)
         self._default_value = default_value
         self._getter = getter
+        # ContextKeys may not have an id yet (see __set_name__), so the names
+        # are resolved when a ContextNamespace is instantiated
+        self._depends_on = None if depends_on is None else tuple(depends_on)
         self._description = description
         self._owner: type[ContextNamespace] | None = None
         self._type = (
@@ -192,24 +215,104 @@ class ContextNamespace(Generic[A], metaclass=ContextNamespaceMeta):
     """A collection of related keys in a context.
 
     meant to be subclassed, with `ContextKeys` as class attributes.
+
+    Parameters
+    ----------
+    context : MutableMapping
+        The context in which to store the keys of this namespace.
+    source : A, optional
+        Object passed to the getters of *computed* keys (those declared with
+        `depends_on`).  If not provided, computed keys are treated like any other
+        key and keep their default value until set.
     """
 
-    def __init__(self, context: MutableMapping) -> None:
+    def __init__(self, context: MutableMapping, source: A | None = None) -> None:
         self._context = context
+        self._source = source
 
         # on instantiation we create an index of defaults and value-getters
         # to speed up retrieval later
         self._defaults: dict[str, Any] = {}  # default values per key
-        self._getters: dict[str, Callable[[A], Any]] = {}  # value getters
-        for name, ctxkey in type(self).__members__.items():
-            self._defaults[name] = ctxkey._default_value
-            if ctxkey._default_value is not MISSING:
-                context[ctxkey.id] = ctxkey._default_value
-            if callable(ctxkey._getter):
-                self._getters[name] = ctxkey._getter
+        self._getters: dict[str, Callable[[A], Any]] = {}  # value getters, by id
+        self._computed: dict[str, str] = {}  # name -> id of keys computed from source
+        # functions undoing `add_derived` and `watch`, see `dispose`
+        self._disposers: list[Callable[[], Any]] = []
+        try:
+            for name, ctxkey in type(self).__members__.items():
+                self._defaults[name] = ctxkey._default_value
+                if ctxkey._default_value is not MISSING:
+                    context[ctxkey.id] = ctxkey._default_value
+                if callable(ctxkey._getter):
+                    self._getters[ctxkey.id] = ctxkey._getter
+                    if source is not None and ctxkey._depends_on is not None:
+                        self._computed[name] = ctxkey.id
+                        if isinstance(context, Context):
+                            dispose = context.add_derived(
+                                ctxkey.id,
+                                partial(self._compute, ctxkey.id),
+                                [str(dep) for dep in ctxkey._depends_on],
+                                lazy=True,
+                            )
+                            self._disposers.append(dispose)
+        except Exception:
+            # don't leave derived keys registered for a half-built namespace
+            self.dispose()
+            raise
+
+        if self._computed and not isinstance(context, Context):
+            self.invalidate()
+
+    def invalidate(self, *keys: str) -> None:
+        """Mark computed `keys` (by default, all of them) as out of date.
+
+        If the context is a `Context`, the keys (and any keys derived from them)
+        are recomputed lazily the next time they are read, and a single `changed`
+        event is emitted.  Otherwise, they are recomputed immediately.
+        """
+        for key in keys:
+            if key not in self._computed:
+                raise KeyError(f"{key!r} is not a computed key of {self!r}")
+        ids = [self._computed[key] for key in keys or self._computed]
+        if not ids:
+            # nothing to do (and `Context.invalidate()` would invalidate all keys)
+            return
+        if isinstance(ctx := self._context, Context):
+            ctx.invalidate(*ids)
+        else:
+            for id_ in ids:
+                ctx[id_] = self._compute(id_)
+
+    def watch(self, signal: SignalInstance, keys: Iterable[str] = ()) -> None:
+        """Invalidate computed `keys` (by default, all) whenever `signal` is emitted.
+
+        This is useful for computed keys that depend on the state of the `source`
+        object rather than on other context keys.
+        """
+        slot = signal.connect(partial(self._on_source_changed, tuple(keys)))
+        self._disposers.append(partial(signal.disconnect, slot))
+
+    def dispose(self) -> None:
+        """Stop computing keys from the source, and stop watching signals.
+
+        Computed keys keep their last value in the context, and another namespace
+        may then compute them (e.g. from a new source object).
+        """
+        self._computed.clear()
+        while self._disposers:
+            self._disposers.pop()()
+
+    def _compute(self, key: str, *_: Any) -> Any:
+        # dependency values are passed by the Context, but getters take the source
+        return self._getters[key](self._source)  # type: ignore [arg-type]
+
+    def _on_source_changed(self, keys: tuple[str, ...], *_: Any) -> None:
+        self.invalidate(*keys)
 
     def reset(self, key: str) -> None:
-        """Reset keys to its default."""
+        """Reset keys to its default (computed keys are invalidated instead)."""
+        if key in self._computed:
+            self.invalidate(key)
+            return
         val = self._defaults[key]
         if val is MISSING:
             with contextlib.suppress(KeyError):
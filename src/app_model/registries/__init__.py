@@ -1,14 +1,33 @@
 """App-model registries, such as menus, keybindings, commands."""
 
 from ._commands_reg import CommandsRegistry, RegisteredCommand
-from ._keybindings_reg import KeyBindingsRegistry
-from ._menus_reg import MenusRegistry
+from ._keybindings_reg import (
+    KeyBindingConflict,
+    KeyBindingDispatcher,
+    KeyBindingsRegistry,
+    KeyBindingTable,
+)
+from ._menus_reg import (
+    MenusRegistry,
+    ResolvedMenuItem,
+    ResolvedMenuNode,
+    ResolvedSubmenu,
+)
+from ._palette import CommandPaletteIndex, PaletteMatch
 from ._register import register_action
 
 __all__ = [
+    "CommandPaletteIndex",
     "CommandsRegistry",
+    "KeyBindingConflict",
+    "KeyBindingDispatcher",
+    "KeyBindingTable",
     "KeyBindingsRegistry",
     "MenusRegistry",
+    "PaletteMatch",
     "RegisteredCommand",
+    "ResolvedMenuItem",
+    "ResolvedMenuNode",
+    "ResolvedSubmenu",
     "register_action",
 ]
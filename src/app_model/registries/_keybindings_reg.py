@@ -1,23 +1,34 @@
 from __future__ import annotations
 
+import ast
+import json
 from bisect import insort_left
 from collections import defaultdict
-from typing import TYPE_CHECKING, NamedTuple
+from collections.abc import Mapping
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Final, Literal, NamedTuple, cast
 
 from psygnal import Signal
 
-from app_model.types import KeyBinding
+from app_model.expressions import (
+    BoolOp,
+    Compare,
+    Constant,
+    Context,
+    UnaryOp,
+    parse_expression,
+)
+from app_model.types import KeyBinding, KeyBindingSource, KeyChord, KeyCode
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Iterator, Mapping
-    from typing import TypeVar
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import IO, TypeVar
 
     from app_model import expressions
     from app_model.types import (
         Action,
         DisposeCallable,
         KeyBindingRule,
-        KeyBindingSource,
     )
 
     CommandDecorator = Callable[[Callable], Callable]
@@ -32,6 +43,7 @@ class _RegisteredKeyBinding(NamedTuple):
     weight: int  # the weight of the binding, for prioritization
     source: KeyBindingSource  # who defined the binding, for prioritization
     when: expressions.Expr | None = None  # condition to enable keybinding
+    layer: str | None = None  # keymap layer, None for the base keymap
 
     def __gt__(self, other: object) -> bool:
         if not isinstance(other, _RegisteredKeyBinding):  # pragma: no cover
@@ -49,6 +61,27 @@ class _RegisteredKeyBinding(NamedTuple):
         return (self.source, self.weight) == (other.source, other.weight)
 
 
+class KeyBindingConflict(NamedTuple):
+    """A set of keybindings that conflict with each other.
+
+    `kind` is one of:
+
+    - `"ambiguous"`: bindings for the same key, with the same source and weight,
+      that may be enabled at the same time (which one runs depends on the order
+      of registration).
+    - `"shadowed"`: the first binding has higher priority (or the same priority,
+      and was registered first) and is enabled whenever the others are, so they
+      can never run.  e.g. an unconditional binding shadows conditional bindings
+      of the same priority registered after it.
+    - `"chord_prefix"`: `key` is bound on its own *and* starts chords. The first
+      bindings are the single key bindings, followed by the chord bindings.
+    """
+
+    key: int
+    kind: Literal["ambiguous", "shadowed", "chord_prefix"]
+    bindings: tuple[_RegisteredKeyBinding, ...]
+
+
 class KeyBindingsRegistry:
     """Registry for keybindings.
 
@@ -60,16 +93,86 @@ class KeyBindingsRegistry:
         (`str`) if `KeyBinding` is rejected, or empty string otherwise.
     """
 
-    registered = Signal()
-    unregistered = Signal()
+    # set[str] of command ids and set[int] of keys of the (un)registered keybindings
+    registered = Signal(set, set)
+    unregistered = Signal(set, set)
+    layers_changed = Signal(tuple)  # tuple[str, ...] of active layers
 
     def __init__(self) -> None:
         self._keymap = defaultdict[int, list[_RegisteredKeyBinding]](list)
+        # named keymap layers, and the stack of active layers (see `push_layer`)
+        self._layers: dict[str, defaultdict[int, list[_RegisteredKeyBinding]]] = {}
+        self._active_layers: list[str] = []
+        # command id -> keybindings of the command (in all keymaps), in order of
+        # registration
+        self._command_index: dict[str, list[_RegisteredKeyBinding]] = {}
+        # first part of a chord -> keys of all registered chords starting with it
+        self._chord_prefixes = defaultdict[int, set[int]](set)
+        # conflicts by key, and keys whose conflicts need to be re-analyzed
+        self._conflicts: dict[int, list[KeyBindingConflict]] = {}
+        self._conflicts_dirty: set[int] = set()
         self._filter_keybinding: Callable[[KeyBinding], str] | None = None
 
     @property
     def _keybindings(self) -> Iterable[_RegisteredKeyBinding]:
-        return (entry for entries in self._keymap.values() for entry in entries)
+        return (
+            entry
+            for keymap in (self._keymap, *self._layers.values())
+            for entries in keymap.values()
+            for entry in entries
+        )
+
+    def _get_layer(self, name: str) -> defaultdict[int, list[_RegisteredKeyBinding]]:
+        if name not in self._layers:
+            self._layers[name] = defaultdict(list)
+        return self._layers[name]
+
+    def _active_keymaps(self) -> list[defaultdict[int, list[_RegisteredKeyBinding]]]:
+        """Return active keymaps, from highest to lowest priority."""
+        return [*(self._layers[n] for n in reversed(self._active_layers)), self._keymap]
+
+    @property
+    def active_layers(self) -> tuple[str, ...]:
+        """Names of the active keymap layers, from bottom to top of the stack."""
+        return tuple(self._active_layers)
+
+    def push_layer(self, name: str) -> None:
+        """Activate the keymap layer `name`, on top of all active layers.
+
+        Keybindings registered in an active layer take precedence over those in
+        lower layers and in the base keymap (regardless of source and weight).  A
+        layer does not need to have any keybindings registered (yet) to be pushed.
+
+        Raises
+        ------
+        ValueError
+            If the layer is already active.
+        """
+        if name in self._active_layers:
+            raise ValueError(f"Keymap layer {name!r} is already active")
+        self._get_layer(name)
+        self._active_layers.append(name)
+        self.layers_changed.emit(self.active_layers)
+
+    def pop_layer(self, name: str | None = None) -> str:
+        """Deactivate the keymap layer `name` (by default, the top layer).
+
+        Returns the name of the deactivated layer.
+
+        Raises
+        ------
+        ValueError
+            If the layer is not active (or no layer is active).
+        """
+        if name is None:
+            if not self._active_layers:
+                raise ValueError("No active keymap layer")
+            name = self._active_layers[-1]
+        elif name not in self._active_layers:
+            raise ValueError(f"Keymap layer {name!r} is not active")
+        self._active_layers.remove(name)
+        self.layers_changed.emit(self.active_layers)
+        return name
 
     @property
     def filter_keybinding(self) -> Callable[[KeyBinding], str] | None:
@@ -102,15 +205,16 @@ class KeyBindingsRegistry:
 
         disposers: list[Callable[[], None]] = []
         msg: list[str] = []
+        # combined `when` expressions, by id of the keybinding's own `when`,
+        # so that keybindings sharing a condition share the combined expression
+        whens: dict[int, expressions.Expr] = {}
         for keyb in keybindings:
-            if action.enablement is not None:
-                kwargs = keyb.model_dump()
-                kwargs["when"] = (
-                    action.enablement
-                    if keyb.when is None
-                    else action.enablement | keyb.when
-                )
-                _keyb = type(keyb)(**kwargs)
+            if (enablement := action.enablement) is not None:
+                if (when := whens.get(id(keyb.when))) is None:
+                    when = enablement if keyb.when is None else enablement | keyb.when
+                    whens[id(keyb.when)] = when
+                # the rule is already validated, so skip re-validation
+                _keyb = keyb.model_copy(update={"when": when})
             else:
                 _keyb = keyb
 
@@ -134,7 +238,7 @@ class KeyBindingsRegistry:
         return _dispose
 
     def register_keybinding_rule(
-        self, id: str, rule: KeyBindingRule
+        self, id: str, rule: KeyBindingRule, *, layer: str | None = None
     ) -> DisposeCallable | None:
         """Register a new keybinding rule.
 
@@ -144,6 +248,10 @@ class KeyBindingsRegistry:
             Command identifier that should be run when the keybinding is triggered
         rule : KeyBindingRule
             KeyBinding information
+        layer : str | None
+            Name of the keymap layer in which to register the keybinding, which
+            is only enabled while that layer is active (see `push_layer`).  By
+            default, the keybinding is registered in the base keymap.
 
         Returns
         -------
@@ -163,40 +271,226 @@ class KeyBindingsRegistry:
                 weight=rule.weight,
                 when=rule.when,
                 source=rule.source,
+                layer=layer,
             )
 
-            # inverse map registry
-            entries = self._keymap[keybinding.to_int()]
-            insort_left(entries, entry)
-
-            self.registered.emit()
+            key = self._add_entry(entry)
+            self.registered.emit({id}, {key})
 
             def _dispose() -> None:
-                # inverse map registry remove
-                entries.remove(entry)
-                self.unregistered.emit()
-                if len(entries) == 0:
-                    del self._keymap[keybinding.to_int()]
+                if self._remove_entry(key, entry):
+                    self.unregistered.emit({id}, {key})
 
             return _dispose
         return None  # pragma: no cover
 
+    def _add_entry(self, entry: _RegisteredKeyBinding) -> int:
+        """Add `entry` to the keymap (without emitting), and return its key."""
+        key = entry.keybinding.to_int()
+        keymap = self._keymap if entry.layer is None else self._get_layer(entry.layer)
+        insort_left(keymap[key], entry)
+        self._command_index.setdefault(entry.command_id, []).append(entry)
+        if prefix := _chord_prefix(key):
+            self._chord_prefixes[prefix].add(key)
+        if entry.layer is None:
+            self._conflicts_dirty.update((key, prefix))
+        return key
+
+    def _remove_entry(self, key: int, entry: _RegisteredKeyBinding) -> bool:
+        """Remove `entry` from the keymap (without emitting).
+
+        Returns False if `entry` was not registered (e.g. already removed).
+        """
+        keymap = self._keymap if entry.layer is None else self._layers[entry.layer]
+        entries = keymap.get(key, [])
+        # remove by identity: entries compare equal when they have the same priority
+        for index, existing in enumerate(entries):
+            if existing is entry:
+                del entries[index]
+                break
+        else:
+            return False
+        by_command = self._command_index[entry.command_id]
+        by_command[:] = [e for e in by_command if e is not entry]
+        if not by_command:
+            del self._command_index[entry.command_id]
+        prefix = _chord_prefix(key)
+        if entry.layer is None:
+            self._conflicts_dirty.update((key, prefix))
+        if not entries:
+            del keymap[key]
+            if prefix and all(
+                key not in km for km in (self._keymap, *self._layers.values())
+            ):
+                self._chord_prefixes[prefix].discard(key)
+                if not self._chord_prefixes[prefix]:
+                    del self._chord_prefixes[prefix]
+        return True
+
+    def load_keymap(
+        self,
+        keymap: str | IO[str] | Iterable[Mapping[str, Any]],
+        source: KeyBindingSource = KeyBindingSource.USER,
+        layer: str | None = None,
+    ) -> DisposeCallable:
+        """Register all keybindings in a (VS Code-like) keymap.
+
+        A keymap is a list of entries with the keys `"key"` (a keybinding string
+        for the current platform, e.g. `"Ctrl+K Ctrl+C"`), `"command"` (the command
+        id), and optionally `"when"`, `"weight"`, `"source"` (the name or value of
+        a `KeyBindingSource`) and `"layer"`.  See `dump_keymap`.
+
+        All entries are validated before any of them is registered, and the
+        `registered` signal is emitted once.
+
+        Parameters
+        ----------
+        keymap : str | IO[str] | Iterable[Mapping[str, Any]]
+            A JSON string, a text stream containing JSON, or an iterable of entries.
+        source : KeyBindingSource
+            The source of entries that don't declare one, by default
+            `KeyBindingSource.USER`.
+        layer : str | None
+            The keymap layer of entries that don't declare one, by default None
+            (the base keymap).
+
+        Returns
+        -------
+        DisposeCallable
+            A function that can be called to unregister all the keybindings.
+
+        Raises
+        ------
+        ValueError
+            If any of the entries is not valid.
+        """
+        items: Iterable[Mapping[str, Any]]
+        if isinstance(keymap, str):
+            items = json.loads(keymap)
+        elif hasattr(keymap, "read"):
+            items = json.load(cast("IO[str]", keymap))
+        else:
+            items = keymap
+
+        entries: list[_RegisteredKeyBinding] = []
+        msg: list[str] = []
+        for i, item in enumerate(items):
+            try:
+                entries.append(self._keymap_entry(item, source, layer))
+            except (TypeError, ValueError, KeyError, SyntaxError) as e:
+                msg.append(f"entry {i}: {e}")
+        if msg:
+            raise ValueError(
+                "The following keymap entries were not valid:\n" + "\n".join(msg)
+            )
+
+        keys = [self._add_entry(entry) for entry in entries]
+        command_ids = {entry.command_id for entry in entries}
+        if entries:
+            self.registered.emit(command_ids, set(keys))
+
+        def _dispose() -> None:
+            removed = [
+                self._remove_entry(key, entry)
+                for key, entry in zip(keys, entries, strict=True)
+            ]
+            if any(removed):
+                self.unregistered.emit(command_ids, set(keys))
+
+        return _dispose
+
+    def _keymap_entry(
+        self, item: Mapping[str, Any], source: KeyBindingSource, layer: str | None
+    ) -> _RegisteredKeyBinding:
+        if not isinstance(item, Mapping):
+            raise TypeError(f"expected a mapping, got {type(item).__name__}")
+        if missing := {"key", "command"}.difference(item):
+            raise ValueError(f"missing required field(s) {sorted(missing)}")
+        keybinding = KeyBinding.from_str(item["key"], strict=True)
+        if self._filter_keybinding and (msg := self._filter_keybinding(keybinding)):
+            raise ValueError(f"{keybinding}: {msg}")
+        src = item.get("source", source)
+        return _RegisteredKeyBinding(
+            keybinding=keybinding,
+            command_id=item["command"],
+            weight=int(item.get("weight", 0)),
+            source=(
+                KeyBindingSource[src.upper()]
+                if isinstance(src, str)
+                else KeyBindingSource(src)
+            ),
+            when=parse_expression(when) if (when := item.get("when")) else None,
+            layer=item.get("layer", layer),
+        )
+
+    def dump_keymap(
+        self, source: KeyBindingSource | None = None, stream: IO[str] | None = None
+    ) -> str:
+        """Return all keybindings (optionally, only from `source`) as a JSON keymap.
+
+        The keymap can be loaded with `load_keymap`.  If `stream` is provided, the
+        JSON is also written to it.
+        """
+        keymap = []
+        for entry in self._keybindings:
+            if source is not None and entry.source != source:
+                continue
+            item: dict[str, Any] = {
+                "key": str(entry.keybinding),
+                "command": entry.command_id,
+            }
+            if entry.when is not None:
+                item["when"] = str(entry.when)
+            if entry.weight:
+                item["weight"] = entry.weight
+            item["source"] = entry.source.name.lower()
+            if entry.layer is not None:
+                item["layer"] = entry.layer
+            keymap.append(item)
+        text = json.dumps(keymap, indent=2, ensure_ascii=False)
+        if stream is not None:
+            stream.write(text)
+        return text
+
     def __iter__(self) -> Iterator[_RegisteredKeyBinding]:
         yield from self._keybindings
 
     def __len__(self) -> int:
-        return sum(len(entries) for entries in self._keymap.values())
+        return sum(
+            len(entries)
+            for keymap in (self._keymap, *self._layers.values())
+            for entries in keymap.values()
+        )
 
     def __repr__(self) -> str:
         name = self.__class__.__name__
         return f"<{name} at {hex(id(self))} ({len(self)} bindings)>"
 
     def get_keybinding(self, command_id: str) -> _RegisteredKeyBinding | None:
-        """Return the first keybinding that matches the given command ID."""
-        # TODO: improve me.
-        matches = (kb for kb in self._keybindings if kb.command_id == command_id)
-        sorted_matches = sorted(matches, key=lambda x: x.source, reverse=True)
-        return next(iter(sorted_matches), None)
+        """Return the first keybinding that matches the given command ID.
+
+        Keybindings in active layers are preferred, and keybindings in inactive
+        layers are ignored.  Within a keymap, the keybinding with the highest
+        source is returned (the first registered one, if several have that source).
+        """
+        if not (entries := self._command_index.get(command_id)):
+            return None
+        for layer in (*reversed(self._active_layers), None):
+            best: _RegisteredKeyBinding | None = None
+            for kb in entries:
+                if kb.layer == layer and (best is None or kb.source > best.source):
+                    best = kb
+            if best is not None:
+                return best
+        return None
+
+    def get_command_keybindings(self) -> dict[str, _RegisteredKeyBinding]:
+        """Return the keybinding `get_keybinding` would return, for every command."""
+        return {
+            command_id: kb
+            for command_id in self._command_index
+            if (kb := self.get_keybinding(command_id)) is not None
+        }
 
     def get_context_prioritized_keybinding(
         self, key: int, context: Mapping[str, object]
@@ -205,6 +499,7 @@ class KeyBindingsRegistry:
         Return the first keybinding that matches the given key sequence.
 
         The keybinding should be enabled given the context to be returned.
+        Keybindings in active layers are searched first (see `push_layer`).
 
         Parameters
         ----------
@@ -220,8 +515,370 @@ class KeyBindingsRegistry:
             The keybinding found or None otherwise.
 
         """
-        if key in self._keymap:
-            for entry in reversed(self._keymap[key]):
-                if entry.when is None or entry.when.eval(context):
+        for name in reversed(self._active_layers):
+            if key in (layer := self._layers[name]):
+                if entry := _first_enabled(layer[key], context):
                     return entry
+        if key in self._keymap:
+            return _first_enabled(self._keymap[key], context)
         return None
+
+    def is_bound(self, key: int) -> bool:
+        """Return True if any keybinding is registered for `key`.
+
+        Keybindings in the base keymap and in active layers are considered,
+        regardless of their `when` clause.
+        """
+        return any(key in keymap for keymap in self._active_keymaps())
+
+    def is_chord_prefix(
+        self, key: int, context: Mapping[str, object] | None = None
+    ) -> bool:
+        """Return True if `key` is the first part of a registered chord.
+
+        Without `context`, chords registered in inactive layers are considered too.
+
+        Parameters
+        ----------
+        key : int
+            The (single part) key combination.
+        context : Mapping[str, object] | None
+            If provided, only chords whose keybinding is enabled in `context`
+            are considered.
+        """
+        if key not in self._chord_prefixes:
+            return False
+        if context is None:
+            return True
+        return any(
+            self.get_context_prioritized_keybinding(chord, context) is not None
+            for chord in self._chord_prefixes[key]
+        )
+
+    def get_conflicts(self, key: int | None = None) -> list[KeyBindingConflict]:
+        """Return conflicting keybindings (see `KeyBindingConflict`).
+
+        Only keys whose bindings changed since the last call are re-analyzed.  Only
+        the base keymap is analyzed (layers are expected to override it).
+
+        `when` clauses are considered to possibly be enabled at the same time
+        unless they are provably mutually exclusive (e.g. `x` and `not x`, or
+        `a == 1` and `a == 2`).  Clauses such as `a > 1` and `a < 5` are thus
+        reported as ambiguous.
+
+        Parameters
+        ----------
+        key : int | None
+            If provided, only return conflicts for this key (or chord prefix).
+        """
+        for k in self._conflicts_dirty:
+            if conflicts := self._find_conflicts(k):
+                self._conflicts[k] = conflicts
+            else:
+                self._conflicts.pop(k, None)
+        self._conflicts_dirty.clear()
+        if key is not None:
+            return list(self._conflicts.get(key, ()))
+        return [c for conflicts in self._conflicts.values() for c in conflicts]
+
+    def _find_conflicts(self, key: int) -> list[KeyBindingConflict]:
+        if not (entries := self._keymap.get(key)):
+            return []
+        conflicts: list[KeyBindingConflict] = []
+        ranked = entries[::-1]  # highest priority first
+        covered: set[int] = set()  # bindings that can never run
+        for i, high in enumerate(ranked):
+            if i in covered:
+                continue
+            ambiguous: list[_RegisteredKeyBinding] = []
+            shadowed: list[_RegisteredKeyBinding] = []
+            for j in range(i + 1, len(ranked)):
+                low = ranked[j]
+                same_when = str(high.when) == str(low.when)
+                if high.when is None or same_when:
+                    # `low` can never run.  With equal priority and conditions,
+                    # only the order of registration decides which one runs.
+                    (ambiguous if low == high and same_when else shadowed).append(low)
+                    covered.add(j)
+                elif low == high and (
+                    low.when is None or not _disjoint(high.when, low.when)
+                ):
+                    conflicts.append(KeyBindingConflict(key, "ambiguous", (high, low)))
+            if ambiguous:
+                conflicts.append(
+                    KeyBindingConflict(key, "ambiguous", (high, *ambiguous))
+                )
+            if shadowed:
+                conflicts.append(KeyBindingConflict(key, "shadowed", (high, *shadowed)))
+        chords = [
+            e
+            for k in self._chord_prefixes.get(key, ())
+            for e in self._keymap.get(k, ())
+        ]
+        if chords:
+            conflicts.append(
+                KeyBindingConflict(key, "chord_prefix", (*ranked, *chords))
+            )
+        return conflicts
+
+    def create_table(self, context: Mapping[str, object]) -> KeyBindingTable:
+        """Return a table of the keybindings enabled in `context`, by key.
+
+        See `KeyBindingTable` for details.
+        """
+        return KeyBindingTable(self, context)
+
+
+def _first_enabled(
+    entries: list[_RegisteredKeyBinding], context: Mapping[str, object]
+) -> _RegisteredKeyBinding | None:
+    """Return the highest priority entry enabled in `context`."""
+    for entry in reversed(entries):
+        if entry.when is None or entry.when.eval(context):
+            return entry
+    return None
+
+
+# comparison operators, and the operator of the opposite comparison
+_NEGATED_CMPOPS: Final[dict[type[ast.cmpop], type[ast.cmpop]]] = {
+    ast.Eq: ast.NotEq,
+    ast.NotEq: ast.Eq,
+    ast.Lt: ast.GtE,
+    ast.GtE: ast.Lt,
+    ast.Gt: ast.LtE,
+    ast.LtE: ast.Gt,
+    ast.In: ast.NotIn,
+    ast.NotIn: ast.In,
+    ast.Is: ast.IsNot,
+    ast.IsNot: ast.Is,
+}
+
+
+def _disjoint(a: expressions.Expr, b: expressions.Expr) -> bool:
+    """Return True if `a` and `b` can never both be true.
+
+    This only recognizes a few simple cases (e.g. `x` and `not x`, or `x == 1`
+    and `x == 2`, possibly as part of an `and`): if False, the conditions may
+    or may not overlap.
+    """
+    for x, y in ((a, b), (b, a)):
+        if isinstance(x, BoolOp) and isinstance(x.op, ast.And):
+            return any(_disjoint(cast("expressions.Expr", v), y) for v in x.values)
+    for x, y in ((a, b), (b, a)):
+        if isinstance(x, UnaryOp) and isinstance(x.op, ast.Not):
+            if str(x.operand) == str(y):
+                return True
+    if not (isinstance(a, Compare) and isinstance(b, Compare)):
+        return False
+    if len(a.ops) != 1 or len(b.ops) != 1 or str(a.left) != str(b.left):
+        return False
+    a_op, b_op = type(a.ops[0]), type(b.ops[0])
+    a_val, b_val = a.comparators[0], b.comparators[0]
+    if str(a_val) == str(b_val):
+        return _NEGATED_CMPOPS.get(a_op) is b_op
+    # equal to different constants
+    return (
+        a_op is b_op is ast.Eq
+        and isinstance(a_val, Constant)
+        and isinstance(b_val, Constant)
+        and a_val.value != b_val.value
+    )
+
+
+def _chord_prefix(key: int) -> int:
+    """Return the first part of `key` if it is a chord, otherwise 0."""
+    return key & 0x0000FFFF if key & 0xFFFF0000 else 0
+
+
+class __pending:
+    """Sentinel... done this way for the purpose of typing."""
+
+    def __repr__(self) -> str:
+        return "PENDING"
+
+
+PENDING: Final = __pending()
+
+# key codes that don't interrupt a pending chord when pressed on their own
+_MODIFIER_KEYS = frozenset(
+    {KeyCode.Ctrl, KeyCode.Shift, KeyCode.Alt, KeyCode.Meta, KeyCode.UNKNOWN}
+)
+
+
+class KeyBindingDispatcher:
+    """Resolve a stream of key presses to keybindings, with support for chords.
+
+    Key presses are the integer representation of a single key combination (as
+    returned by `SimpleKeyBinding.to_int`).  When a key press starts a chord
+    enabled in the current context, the dispatcher returns `PENDING` and waits for
+    the second part of the chord.
+
+    Parameters
+    ----------
+    registry : KeyBindingsRegistry
+        The registry in which to look up keybindings.
+    chord_timeout : float | None
+        Seconds after which a pending chord is abandoned, by default 5.
+        If `None`, pending chords never time out.
+
+    Examples
+    --------
+    >>> dispatcher = KeyBindingDispatcher(app.keybindings)
+    >>> dispatcher.dispatch(KeyMod.CtrlCmd | KeyCode.KeyK, app.context)
+    PENDING
+    >>> dispatcher.dispatch(KeyMod.CtrlCmd | KeyCode.KeyC, app.context)
+    _RegisteredKeyBinding(..., command_id='editor.comment', ...)
+    """
+
+    PENDING = PENDING
+
+    def __init__(
+        self, registry: KeyBindingsRegistry, chord_timeout: float | None = 5
+    ) -> None:
+        self._registry = registry
+        self.chord_timeout = chord_timeout
+        self._pending: int | None = None
+        self._pending_since = 0.0
+
+    @property
+    def pending(self) -> int | None:
+        """The first part of the chord being entered, if any."""
+        if self._pending is not None and self.chord_timeout is not None:
+            if monotonic() - self._pending_since > self.chord_timeout:
+                self._pending = None
+        return self._pending
+
+    def reset(self) -> None:
+        """Abandon any pending chord."""
+        self._pending = None
+
+    def dispatch(
+        self, key: int, context: Mapping[str, object]
+    ) -> _RegisteredKeyBinding | __pending | None:
+        """Process a key press.
+
+        Parameters
+        ----------
+        key : int
+            The (single part) key combination that was pressed.
+        context : Mapping[str, object]
+            Context in which to evaluate the `when` clause of keybindings.
+
+        Returns
+        -------
+        _RegisteredKeyBinding | PENDING | None
+            The keybinding to run, `PENDING` if `key` started a chord (or was a
+            bare modifier pressed while a chord is pending), or None if no
+            keybinding matched.  Note that the second part of a chord is always
+            consumed, even if the resulting chord is not bound.
+        """
+        if (first := self.pending) is not None:
+            if key & 0x00FF in _MODIFIER_KEYS:
+                return PENDING
+            self._pending = None
+            return self._registry.get_context_prioritized_keybinding(
+                KeyChord(first, key), context
+            )
+        if self._registry.is_chord_prefix(key, context):
+            self._pending = key
+            self._pending_since = monotonic()
+            return PENDING
+        return self._registry.get_context_prioritized_keybinding(key, context)
+
+
+class KeyBindingTable(Mapping[int, _RegisteredKeyBinding]):
+    """Mapping of key to the highest priority keybinding enabled in a context.
+
+    The table is resolved once (when first accessed), so that looking up the
+    keybinding for a key press is a single dict lookup.  If `context` is a
+    `Context`, the entries whose `when` clauses use a changed context key are
+    re-resolved when `Context.changed` is emitted.  (Changes to a plain mapping
+    are not detected, call `invalidate` after modifying it.)  Any change to the
+    registry (including to its active layers) triggers a full rebuild of the table
+    on next access.
+
+    Parameters
+    ----------
+    registry : KeyBindingsRegistry
+        The registry from which to resolve keybindings.
+    context : Mapping[str, object]
+        Context in which to evaluate the `when` clause of keybindings.
+    """
+
+    def __init__(
+        self, registry: KeyBindingsRegistry, context: Mapping[str, object]
+    ) -> None:
+        self._registry = registry
+        self._context = context
+        self._table: dict[int, _RegisteredKeyBinding] = {}
+        # context key name -> keys with a `when` clause using that name
+        self._keys_by_name = defaultdict[str, set[int]](set)
+        self._dirty = True
+        registry.registered.connect(self.invalidate)
+        registry.unregistered.connect(self.invalidate)
+        registry.layers_changed.connect(self.invalidate)
+        if isinstance(context, Context):
+            context.changed.connect(self._on_context_changed)
+
+    def invalidate(self) -> None:
+        """Mark the whole table as out of date."""
+        self._dirty = True
+
+    def _rebuild(self) -> None:
+        self._table.clear()
+        self._keys_by_name.clear()
+        keys: set[int] = set()
+        for keymap in self._registry._active_keymaps():
+            for key, entries in keymap.items():
+                keys.add(key)
+                for entry in entries:
+                    if entry.when is not None:
+                        for name in entry.when._names:
+                            self._keys_by_name[name].add(key)
+        for key in keys:
+            self._resolve(key)
+        self._dirty = False
+
+    def _resolve(self, key: int) -> None:
+        reg = self._registry
+        if entry := reg.get_context_prioritized_keybinding(key, self._context):
+            self._table[key] = entry
+        else:
+            self._table.pop(key, None)
+
+    def _on_context_changed(self, changed: set[str]) -> None:
+        if self._dirty:
+            return
+        keys_by_name = self._keys_by_name
+        keys: set[int] = set()
+        for name in changed:
+            if name in keys_by_name:
+                keys.update(keys_by_name[name])
+        for key in keys:
+            self._resolve(key)
+
+    def __getitem__(self, key: int) -> _RegisteredKeyBinding:
+        if self._dirty:
+            self._rebuild()
+        return self._table[key]
+
+    def get(self, key: int, default: Any = None) -> Any:
+        """Return the keybinding for `key`, or `default` if no keybinding is enabled."""
+        if self._dirty:
+            self._rebuild()
+        return self._table.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        if self._dirty:
+            self._rebuild()
+        return key in self._table
+
+    def __iter__(self) -> Iterator[int]:
+        if self._dirty:
+            self._rebuild()
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        if self._dirty:
+            self._rebuild()
+        return len(self._table)
@@ -1,17 +1,45 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Final, cast
+from typing import TYPE_CHECKING, Final, NamedTuple, TypeAlias, cast
 
 from psygnal import Signal
 
-from app_model.types import MenuItem
+from app_model.expressions import Expr
+from app_model.types import MenuItem, SubmenuItem, ToggleRule
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Iterator
+    from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
 
     from app_model.types import Action, DisposeCallable, MenuOrSubmenu
 
 MenuId = str
+_Placement = tuple[MenuId, "MenuOrSubmenu"]
+
+
+class ResolvedMenuItem(NamedTuple):
+    """A visible `MenuItem`, evaluated in a context by `MenusRegistry.resolve_menu`.
+
+    `toggled` is `None` if the command is not toggleable, or if its toggle state
+    cannot be determined from the context alone (`ToggleRule.get_current`).
+    """
+
+    item: MenuItem
+    enabled: bool
+    toggled: bool | None
+
+
+class ResolvedSubmenu(NamedTuple):
+    """A visible `SubmenuItem`, evaluated by `MenusRegistry.resolve_menu`.
+
+    `groups` holds the resolved, sorted groups of the submenu's items.
+    """
+
+    item: SubmenuItem
+    enabled: bool
+    groups: list[list[ResolvedMenuNode]]
+
+
+ResolvedMenuNode: TypeAlias = ResolvedMenuItem | ResolvedSubmenu
 
 
 class MenusRegistry:
@@ -19,17 +47,27 @@ class MenusRegistry:
 
     COMMAND_PALETTE_ID: Final = "_command_pallet_"
     menus_changed = Signal(set)
+    # set[str] of ids of the commands (or alt commands) of added/removed MenuItems
+    placements_changed = Signal(set)
 
     def __init__(self) -> None:
         self._menu_items: dict[MenuId, dict[MenuOrSubmenu, None]] = {}
-
-    def append_action_menus(self, action: Action) -> DisposeCallable | None:
+        # owner -> placements of each `append_menu_items` call made for that owner
+        self._owned: dict[Hashable, list[list[_Placement]]] = {}
+        # command id -> menu id -> menu items using that command
+        self._command_index: dict[str, dict[MenuId, dict[MenuItem, None]]] = {}
+
+    def append_action_menus(
+        self, action: Action, *, owner: Hashable | None = None
+    ) -> DisposeCallable | None:
         """Append all MenuRule items declared in `action.menus`.
 
         Parameters
         ----------
         action : Action
             The action containing menus to append.
+        owner : Hashable, optional
+            Owner of the menu items (e.g. a plugin name), see `dispose_owner`.
 
         Returns
         -------
@@ -38,20 +76,33 @@ class MenusRegistry:
             menu items were registered, returns `None`.
         """
         disposers: list[Callable[[], None]] = []
+        # all fields come from the (validated) action, so skip validation, and
+        # share a single CommandRule between all menu items of the action
+        command = action._as_command_rule()
         disp1 = self.append_menu_items(
             (
-                rule.id,
-                MenuItem(
-                    command=action, when=rule.when, group=rule.group, order=rule.order
-                ),
-            )
-            for rule in action.menus or ()
+                (
+                    rule.id,
+                    MenuItem.model_construct(
+                        command=command,
+                        when=rule.when,
+                        group=rule.group,
+                        order=rule.order,
+                    ),
+                )
+                for rule in action.menus or ()
+            ),
+            owner=owner,
         )
         disposers.append(disp1)
 
         if action.palette:
-            menu_item = MenuItem(command=action, when=action.enablement)
-            disp = self.append_menu_items([(self.COMMAND_PALETTE_ID, menu_item)])
+            menu_item = MenuItem.model_construct(
+                command=command, when=action.enablement
+            )
+            disp = self.append_menu_items(
+                [(self.COMMAND_PALETTE_ID, menu_item)], owner=owner
+            )
             disposers.append(disp)
 
         if not disposers:  # pragma: no cover
@@ -64,7 +115,10 @@ class MenusRegistry:
         return _dispose
 
     def append_menu_items(
-        self, items: Iterable[tuple[MenuId, MenuOrSubmenu | dict]]
+        self,
+        items: Iterable[tuple[MenuId, MenuOrSubmenu | dict]],
+        *,
+        owner: Hashable | None = None,
     ) -> DisposeCallable:
         """Append menu items to the registry.
 
@@ -72,38 +126,100 @@ class MenusRegistry:
         ----------
         items : Iterable[Tuple[str, MenuOrSubmenu]]
             Items to append.
+        owner : Hashable, optional
+            Owner of the menu items (e.g. a plugin name).  All items appended for
+            an owner can be removed at once with `dispose_owner`.
 
         Returns
         -------
         DisposeCallable
             A function that can be called to unregister the menu items.
         """
-        changed_ids: set[str] = set()
-        disposers: list[Callable[[], None]] = []
+        placements: list[_Placement] = []
+        command_ids: set[str] = set()
         for menu_id, item in items:
             item = cast("MenuOrSubmenu", MenuItem._validate(item))
-            menu_dict = self._menu_items.setdefault(menu_id, {})
-            menu_dict[item] = None
-            changed_ids.add(menu_id)
-
-            def _remove(dct: dict = menu_dict, _item: Any = item) -> None:
-                dct.pop(_item, None)
+            self._menu_items.setdefault(menu_id, {})[item] = None
+            placements.append((menu_id, item))
+            if isinstance(item, MenuItem):
+                for cmd_id in _command_ids(item):
+                    index = self._command_index.setdefault(cmd_id, {})
+                    index.setdefault(menu_id, {})[item] = None
+                    command_ids.add(cmd_id)
 
-            disposers.append(_remove)
+        if owner is not None:
+            self._owned.setdefault(owner, []).append(placements)
 
         def _dispose() -> None:
-            for disposer in disposers:
-                disposer()
-            for id_ in changed_ids:
-                if not self._menu_items.get(id_):
-                    del self._menu_items[id_]
-            self.menus_changed.emit(changed_ids)
+            if owner is not None and (owned := self._owned.get(owner)):
+                owned[:] = [p for p in owned if p is not placements]
+                if not owned:
+                    del self._owned[owner]
+            removed_ids: set[str] = set()
+            if changed_ids := self._remove_placements(placements, removed_ids):
+                self._emit_changed(changed_ids, removed_ids)
 
-        if changed_ids:
-            self.menus_changed.emit(changed_ids)
+        if placements:
+            self._emit_changed({menu_id for menu_id, _ in placements}, command_ids)
 
         return _dispose
 
+    def dispose_owner(self, owner: Hashable) -> None:
+        """Remove all menu items appended for `owner`.
+
+        `menus_changed` is emitted once, with the ids of all menus that changed.
+        """
+        changed_ids: set[MenuId] = set()
+        command_ids: set[str] = set()
+        for placements in self._owned.pop(owner, ()):
+            changed_ids.update(self._remove_placements(placements, command_ids))
+        if changed_ids:
+            self._emit_changed(changed_ids, command_ids)
+
+    def _emit_changed(self, menu_ids: set[MenuId], command_ids: set[str]) -> None:
+        if command_ids:
+            self.placements_changed.emit(command_ids)
+        self.menus_changed.emit(menu_ids)
+
+    def _remove_placements(
+        self, placements: Iterable[_Placement], command_ids: set[str]
+    ) -> set[MenuId]:
+        """Remove menu items (without emitting), and return ids of changed menus.
+
+        The ids of the commands of removed `MenuItem`s are added to `command_ids`.
+        """
+        changed_ids: set[MenuId] = set()
+        menu_items = self._menu_items
+        for menu_id, item in placements:
+            if (menu := menu_items.get(menu_id)) is not None:
+                if menu.pop(item, False) is None:
+                    changed_ids.add(menu_id)
+                    if isinstance(item, MenuItem):
+                        self._unindex(menu_id, item)
+                        command_ids.update(_command_ids(item))
+                if not menu:
+                    del menu_items[menu_id]
+        return changed_ids
+
+    def _unindex(self, menu_id: MenuId, item: MenuItem) -> None:
+        for cmd_id in _command_ids(item):
+            index = self._command_index[cmd_id]
+            del index[menu_id][item]
+            if not index[menu_id]:
+                del index[menu_id]
+                if not index:
+                    del self._command_index[cmd_id]
+
+    def get_command_placements(self, command_id: str) -> dict[MenuId, list[MenuItem]]:
+        """Return the menu items that use `command_id`, by menu id.
+
+        This includes menu items using `command_id` as their `alt` command.
+        """
+        return {
+            menu_id: list(items)
+            for menu_id, items in self._command_index.get(command_id, {}).items()
+        }
+
     def __iter__(
         self,
     ) -> Iterator[tuple[MenuId, Iterable[MenuOrSubmenu]]]:
@@ -169,6 +285,90 @@ class MenusRegistry:
         if menu_id in self:
             yield from _sort_groups(self.get_menu(menu_id))
 
+    def resolve_menu(
+        self, menu_id: MenuId, context: Mapping[str, object]
+    ) -> list[list[ResolvedMenuNode]]:
+        """Return the visible items of `menu_id`, fully resolved in `context`.
+
+        Submenus are followed recursively.  Items whose `when` clause is false are
+        omitted (for submenus, the entire subtree is skipped without evaluation).
+        Each expression object is evaluated at most once per call, so clauses shared
+        by many items (e.g. the enablement of an action) are only evaluated once.
+
+        Parameters
+        ----------
+        menu_id : str
+            The id of the root menu to resolve.
+        context : Mapping[str, object]
+            Namespace used to evaluate the `when`, `enablement` and `toggled`
+            expressions.
+
+        Returns
+        -------
+        list[list[ResolvedMenuNode]]
+            Groups of resolved items, sorted as in `iter_menu_groups`.  Empty
+            groups are omitted.
+
+        Raises
+        ------
+        ValueError
+            If a submenu (directly or indirectly) contains itself.
+        """
+        results: dict[int, bool] = {}
+
+        def _eval(expr: Expr | None) -> bool:
+            if expr is None:
+                return True
+            # keyed by id: expressions are alive (held by the items) for the call
+            if (key := id(expr)) not in results:
+                results[key] = bool(expr.eval(context))
+            return results[key]
+
+        def _resolve(
+            menu_id: MenuId, path: list[MenuId]
+        ) -> list[list[ResolvedMenuNode]]:
+            if menu_id in path:
+                cycle = " -> ".join([*path[path.index(menu_id) :], menu_id])
+                raise ValueError(f"Cycle detected in submenus: {cycle}")
+            path.append(menu_id)
+            groups: list[list[ResolvedMenuNode]] = []
+            for group in self.iter_menu_groups(menu_id):
+                resolved: list[ResolvedMenuNode] = []
+                for item in group:
+                    if not _eval(item.when):
+                        continue
+                    if isinstance(item, SubmenuItem):
+                        resolved.append(
+                            ResolvedSubmenu(
+                                item,
+                                _eval(item.enablement),
+                                _resolve(item.submenu, path),
+                            )
+                        )
+                    else:
+                        command = item.command
+                        toggled = command.toggled
+                        if isinstance(toggled, ToggleRule):
+                            toggled = toggled.condition
+                        resolved.append(
+                            ResolvedMenuItem(
+                                item,
+                                _eval(command.enablement),
+                                _eval(toggled) if isinstance(toggled, Expr) else None,
+                            )
+                        )
+                if resolved:
+                    groups.append(resolved)
+            path.pop()
+            return groups
+
+        return _resolve(menu_id, [])
+
+
+def _command_ids(item: MenuItem) -> set[str]:
+    """Return the ids of the command (and alt command) of `item`."""
+    return {item.command.id} if item.alt is None else {item.command.id, item.alt.id}
+
 
 def _sort_groups(
     items: list[MenuOrSubmenu],
@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from app_model.types import MenuItem
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from app_model.expressions import Expr
+
+    from ._keybindings_reg import KeyBindingsRegistry
+    from ._menus_reg import MenusRegistry
+
+# scoring of a single matched character, loosely following VS Code's fuzzyScore
+_MATCH = 1
+_SAME_CASE = 1
+_START = 8  # first character of the text
+_WORD_START = 6  # character following a separator
+_CAMEL = 4  # upper case character following a lower case character
+_CONSECUTIVE = 5  # character directly following the previously matched one
+_SEPARATORS = frozenset(" _-.:/\\()[]")
+
+
+class PaletteMatch(NamedTuple):
+    """A command palette item matching a search query.
+
+    `highlights` are the `(start, stop)` spans of `text` matched by the query,
+    where `text` is the (title, short title or keybinding) text that matched best.
+    """
+
+    item: MenuItem
+    score: int
+    text: str
+    highlights: tuple[tuple[int, int], ...]
+
+
+class _Entry(NamedTuple):
+    item: MenuItem
+    texts: tuple[str, ...]
+    mask: int
+
+
+class CommandPaletteIndex:
+    """Fuzzy search index over the items of the command palette menu.
+
+    The index follows the items appended to (and disposed from)
+    `MenusRegistry.COMMAND_PALETTE_ID`, and, if `keybindings` is provided, the
+    keybindings of their commands.  Each item is searchable by its label
+    (`"{category}: {title}"`), its short title and its keybinding text.
+
+    A search only scores the items containing all characters of the query, and
+    when the query extends the previous query (as when typing), only the items
+    that matched the previous query are considered.
+
+    Parameters
+    ----------
+    menus : MenusRegistry
+        The menus registry holding the command palette items.
+    keybindings : KeyBindingsRegistry | None
+        If provided, items are also searchable by the text of their keybinding.
+    """
+
+    def __init__(
+        self, menus: MenusRegistry, keybindings: KeyBindingsRegistry | None = None
+    ) -> None:
+        self._menus = menus
+        self._keybindings = keybindings
+        self._entries: dict[MenuItem, _Entry] = {}
+        # command id -> palette items of the command
+        self._command_items: dict[str, dict[MenuItem, None]] = {}
+        self._key_texts: dict[str, str] = {}
+        # (query, entries matching query) of the last search
+        self._last: tuple[str, list[_Entry]] | None = None
+        menus.placements_changed.connect(self._on_placements_changed)
+        if keybindings is not None:
+            keybindings.registered.connect(self._on_keybindings_registered)
+            keybindings.unregistered.connect(self._on_keybindings_registered)
+            keybindings.layers_changed.connect(self._on_keybindings_changed)
+            self._key_texts = self._get_key_texts()
+        self._sync()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_key_texts(self) -> dict[str, str]:
+        assert self._keybindings is not None
+        return {
+            cmd_id: kb.keybinding.to_text()
+            for cmd_id, kb in self._keybindings.get_command_keybindings().items()
+        }
+
+    def _palette_items(self) -> list[MenuItem]:
+        menu_id = self._menus.COMMAND_PALETTE_ID
+        if menu_id not in self._menus:
+            return []
+        return [i for i in self._menus.get_menu(menu_id) if isinstance(i, MenuItem)]
+
+    def _make_entry(self, item: MenuItem) -> _Entry:
+        cmd = item.command
+        label = f"{cmd.category}: {cmd.title}" if cmd.category else cmd.title
+        texts = [label]
+        if cmd.short_title:
+            texts.append(cmd.short_title)
+        if key_text := self._key_texts.get(cmd.id):
+            texts.append(key_text)
+        return _Entry(item, tuple(texts), _char_mask("".join(texts)))
+
+    def _sync(self) -> None:
+        """Create entries for all palette items."""
+        for item in self._palette_items():
+            self._add(item)
+        self._last = None
+
+    def _add(self, item: MenuItem) -> None:
+        if item not in self._entries:
+            self._entries[item] = self._make_entry(item)
+            self._command_items.setdefault(item.command.id, {})[item] = None
+
+    def _on_placements_changed(self, command_ids: set[str]) -> None:
+        """Add and remove the palette items of `command_ids` only."""
+        palette_id = self._menus.COMMAND_PALETTE_ID
+        for cmd_id in command_ids:
+            placements = self._menus.get_command_placements(cmd_id)
+            # placements also include items using `cmd_id` as their alt command
+            items = {
+                i: None
+                for i in placements.get(palette_id, ())
+                if i.command.id == cmd_id
+            }
+            current = self._command_items.get(cmd_id, {})
+            if items.keys() == current.keys():
+                continue
+            for item in [i for i in current if i not in items]:
+                del self._entries[item]
+                del current[item]
+            if not current:
+                self._command_items.pop(cmd_id, None)
+            for item in items:
+                self._add(item)
+            self._last = None
+
+    def _on_keybindings_registered(self, command_ids: set[str]) -> None:
+        """Update the keybinding texts of `command_ids` only."""
+        assert self._keybindings is not None
+        key_texts = self._key_texts
+        changed: list[str] = []
+        for cmd_id in command_ids:
+            kb = self._keybindings.get_keybinding(cmd_id)
+            text = kb.keybinding.to_text() if kb else None
+            if text != key_texts.get(cmd_id):
+                if text is None:
+                    del key_texts[cmd_id]
+                else:
+                    key_texts[cmd_id] = text
+                changed.append(cmd_id)
+        self._update_entries(changed)
+
+    def _on_keybindings_changed(self) -> None:
+        key_texts = self._get_key_texts()
+        changed = [
+            cmd_id
+            for cmd_id in key_texts.keys() | self._key_texts.keys()
+            if key_texts.get(cmd_id) != self._key_texts.get(cmd_id)
+        ]
+        self._key_texts = key_texts
+        self._update_entries(changed)
+
+    def _update_entries(self, command_ids: Iterable[str]) -> None:
+        """Recreate the entries of the palette items of `command_ids`."""
+        for cmd_id in command_ids:
+            for item in self._command_items.get(cmd_id, ()):
+                self._entries[item] = self._make_entry(item)
+                self._last = None
+
+    def search(
+        self,
+        query: str,
+        context: Mapping[str, object] | None = None,
+        *,
+        limit: int | None = None,
+    ) -> list[PaletteMatch]:
+        """Return the palette items matching `query`, best matches first.
+
+        Characters of `query` must appear in order (but not necessarily
+        contiguously) in one of the searchable texts of an item.  Whitespace in
+        `query` is ignored.  An empty query matches all items, in their
+        registration order.
+
+        Parameters
+        ----------
+        query : str
+            The search query.
+        context : Mapping[str, object] | None
+            If provided, items whose `when` clause is false in `context` are
+            excluded.
+        limit : int | None
+            Maximum number of matches to return.  By default, all matches are
+            returned.
+
+        Returns
+        -------
+        list[PaletteMatch]
+            The matching items, sorted by descending score.
+        """
+        query = "".join(query.split())
+        lquery = query.lower()
+        if (last := self._last) is not None and lquery.startswith(last[0]):
+            candidates: Iterable[_Entry] = last[1]
+        else:
+            candidates = self._entries.values()
+
+        if lquery:
+            qmask = _char_mask(lquery)
+            candidates = [e for e in candidates if qmask & e.mask == qmask]
+        matches: list[PaletteMatch] = []
+        matched: list[_Entry] = []
+        for entry in candidates:
+            best: PaletteMatch | None = None
+            for text in entry.texts:
+                if (result := fuzzy_score(query, text)) is not None:
+                    if best is None or result[0] > best.score:
+                        best = PaletteMatch(entry.item, result[0], text, result[1])
+            if best is not None:
+                matched.append(entry)
+                matches.append(best)
+        self._last = (lquery, matched)
+
+        if context is not None:
+            results: dict[int, bool] = {}
+
+            def _eval(expr: Expr | None) -> bool:
+                if expr is None:
+                    return True
+                if (key := id(expr)) not in results:
+                    results[key] = bool(expr.eval(context))
+                return results[key]
+
+            matches = [m for m in matches if _eval(m.item.when)]
+
+        matches.sort(key=lambda m: -m.score)
+        return matches if limit is None else matches[:limit]
+
+    def dispose(self) -> None:
+        """Stop following changes to the menus and keybindings registries."""
+        self._menus.placements_changed.disconnect(self._on_placements_changed)
+        if (keybindings := self._keybindings) is not None:
+            keybindings.registered.disconnect(self._on_keybindings_registered)
+            keybindings.unregistered.disconnect(self._on_keybindings_registered)
+            keybindings.layers_changed.disconnect(self._on_keybindings_changed)
+
+
+def _char_mask(text: str) -> int:
+    """Return a bitmask of the (lower case) characters in `text`.
+
+    Distinct characters may share a bit, so this can only be used to rule out
+    texts that do not contain all characters of a query.
+    """
+    mask = 0
+    for char in text.lower():
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def fuzzy_score(
+    query: str, text: str
+) -> tuple[int, tuple[tuple[int, int], ...]] | None:
+    """Score how well `query` fuzzy-matches `text`.
+
+    All characters of `query` must appear in `text` in the same order (ignoring
+    case).  Among all possible alignments, the one with the highest score is
+    chosen, favoring matches at the start of words, consecutive matches and
+    matching case.
+
+    Parameters
+    ----------
+    query : str
+        The query to match.
+    text : str
+        The text to match against.
+
+    Returns
+    -------
+    tuple[int, tuple[tuple[int, int], ...]] | None
+        `None` if `query` does not match `text`, otherwise the score and the
+        `(start, stop)` spans of `text` matched by `query`.
+    """
+    n, m = len(query), len(text)
+    if not n:
+        return 0, ()
+    lquery, ltext = query.lower(), text.lower()
+    # quick rejection: characters must at least appear in order
+    pos = -1
+    for char in lquery:
+        if (pos := ltext.find(char, pos + 1)) < 0:
+            return None
+
+    char_scores = [_char_score(text, j) for j in range(m)]
+    # best[j]: best score of matching query[: i + 1] with query[i] at text[j]
+    best: list[int] = []
+    back: list[list[int]] = []
+    for i in range(n):
+        row = [-1] * m
+        ptr = [-1] * m
+        qchar, lqchar = query[i], lquery[i]
+        run, run_k = -1, -1  # best of previous row over positions < j - 1
+        for j in range(i, m):
+            if i and j >= 2 and best[j - 2] > run:
+                run, run_k = best[j - 2], j - 2
+            if ltext[j] != lqchar:
+                continue
+            score = char_scores[j] + (_SAME_CASE if text[j] == qchar else 0)
+            if not i:
+                row[j] = score
+                continue
+            prev, k = run, run_k
+            if best[j - 1] >= 0 and best[j - 1] + _CONSECUTIVE >= prev:
+                prev, k = best[j - 1] + _CONSECUTIVE, j - 1
+            if prev >= 0:
+                row[j], ptr[j] = prev + score, k
+        best = row
+        back.append(ptr)
+
+    score = max(best)
+    if score < 0:  # pragma: no cover
+        return None
+    positions = [best.index(score)]
+    for i in range(n - 1, 0, -1):
+        positions.append(back[i][positions[-1]])
+    positions.reverse()
+
+    spans: list[tuple[int, int]] = []
+    for j in positions:
+        if spans and spans[-1][1] == j:
+            spans[-1] = (spans[-1][0], j + 1)
+        else:
+            spans.append((j, j + 1))
+    return score, tuple(spans)
+
+
+def _char_score(text: str, j: int) -> int:
+    if not j:
+        return _MATCH + _START
+    prev = text[j - 1]
+    if prev in _SEPARATORS:
+        return _MATCH + _WORD_START
+    if prev.islower() and text[j].isupper():
+        return _MATCH + _CAMEL
+    return _MATCH
@@ -9,6 +9,7 @@ from ._icon import Icon
 from ._keybinding_rule import KeyBindingRule
 from ._keys import (
     KeyBinding,
+    KeyBindingParseError,
     KeyChord,
     KeyCode,
     KeyCombo,
@@ -39,6 +40,7 @@ __all__ = [
     "CommandRule",
     "Icon",
     "KeyBinding",
+    "KeyBindingParseError",
     "KeyBindingRule",
     "KeyBindingSource",
     "KeyChord",
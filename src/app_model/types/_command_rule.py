@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 from pydantic import Field
 
@@ -32,6 +33,13 @@ class CommandRule(_BaseModel):
     category label.
     """
 
+    # values cached by `_as_command_rule` and `__hash__`.  Slots are neither
+    # compared by `__eq__` nor carried over by `model_copy`.
+    __slots__ = ("_cached_command_rule", "_cached_hash")
+    if TYPE_CHECKING:
+        _cached_command_rule: "CommandRule"
+        _cached_hash: int
+
     id: str = Field(..., description="A global identifier for the command.")
     title: str = Field(
         ...,
@@ -85,5 +93,28 @@ class CommandRule(_BaseModel):
     )
 
     def _as_command_rule(self) -> "CommandRule":
-        """Simplify (subclasses) to a plain CommandRule."""
-        return CommandRule(**{f: getattr(self, f) for f in CommandRule.__annotations__})
+        """Simplify (subclasses) to a plain CommandRule.
+
+        The result is cached, so that all menu items of an action share it.
+        """
+        if type(self) is CommandRule:
+            return self
+        try:
+            return self._cached_command_rule
+        except AttributeError:
+            # fields of an existing instance are already validated
+            rule = CommandRule.model_construct(
+                **{f: getattr(self, f) for f in CommandRule.__annotations__}
+            )
+            object.__setattr__(self, "_cached_command_rule", rule)
+            return rule
+
+    def __hash__(self) -> int:
+        # fields are frozen, so the hash can be cached (MenuItems hash their command)
+        try:
+            return self._cached_hash
+        except AttributeError:
+            fields = type(self).model_fields
+            value = hash((type(self), *(self.__dict__[f] for f in fields)))
+            object.__setattr__(self, "_cached_hash", value)
+            return value
@@ -1,9 +1,10 @@
 from ._key_codes import KeyChord, KeyCode, KeyCombo, KeyMod, ScanCode
-from ._keybindings import KeyBinding, SimpleKeyBinding
+from ._keybindings import KeyBinding, KeyBindingParseError, SimpleKeyBinding
 from ._standard_bindings import StandardKeyBinding
 
 __all__ = [
     "KeyBinding",
+    "KeyBindingParseError",
     "KeyChord",
     "KeyCode",
     "KeyCombo",
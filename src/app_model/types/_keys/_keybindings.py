@@ -1,55 +1,130 @@
 import re
+from collections.abc import Mapping
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field
 
 from app_model.types._constants import OperatingSystem
 
 from ._key_codes import KeyChord, KeyCode, KeyMod
 
 if TYPE_CHECKING:
+    from pydantic import TypeAdapter
     from pydantic.annotated_handlers import GetCoreSchemaHandler
     from pydantic_core import core_schema
 
 
-class SimpleKeyBinding(BaseModel):
-    """Represent a simple combination modifier(s) and a key, e.g. Ctrl+A."""
+# bit layout of the (OS independent) code backing a SimpleKeyBinding:
+# the KeyCode in the lowest 8 bits, followed by one bit per modifier.
+_KEY_MASK = 0xFF
+_NO_KEY = 0xFF  # key is None
+_CTRL = 1 << 8
+_SHIFT = 1 << 9
+_ALT = 1 << 10
+_META = 1 << 11
 
-    ctrl: bool = Field(False, description='Whether the "Ctrl" modifier is active.')
-    shift: bool = Field(False, description='Whether the "Shift" modifier is active.')
-    alt: bool = Field(False, description='Whether the "Alt" modifier is active.')
-    meta: bool = Field(False, description='Whether the "Meta" modifier is active.')
-    key: KeyCode | None = Field(
-        None, description="The key that is pressed (e.g. `KeyCode.A`)"
-    )
+_MODIFIER_KEYS = frozenset(
+    {KeyCode.Alt, KeyCode.Shift, KeyCode.Ctrl, KeyCode.Meta, KeyCode.UNKNOWN}
+)
+
+
+class SimpleKeyBinding:
+    """Represent a simple combination modifier(s) and a key, e.g. Ctrl+A.
+
+    Instances are immutable, and backed by a single integer.
+
+    Parameters
+    ----------
+    ctrl : bool
+        Whether the "Ctrl" modifier is active.
+    shift : bool
+        Whether the "Shift" modifier is active.
+    alt : bool
+        Whether the "Alt" modifier is active.
+    meta : bool
+        Whether the "Meta" modifier is active.
+    key : KeyCode | int | str | None
+        The key that is pressed (e.g. `KeyCode.A`).  Ints and strings are
+        converted with `KeyCode.validate`.
+    """
+
+    __slots__ = ("_code",)
+    _code: int
+
+    def __init__(
+        self,
+        ctrl: bool = False,
+        shift: bool = False,
+        alt: bool = False,
+        meta: bool = False,
+        key: KeyCode | int | str | None = None,
+    ) -> None:
+        code = _NO_KEY if key is None else KeyCode.validate(key)
+        if ctrl:
+            code |= _CTRL
+        if shift:
+            code |= _SHIFT
+        if alt:
+            code |= _ALT
+        if meta:
+            code |= _META
+        object.__setattr__(self, "_code", code)
+
+    @classmethod
+    def _from_code(cls, code: int) -> "SimpleKeyBinding":
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "_code", code)
+        return obj
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self)._from_code, (self._code,))
+
+    @property
+    def ctrl(self) -> bool:
+        """Whether the "Ctrl" modifier is active."""
+        return bool(self._code & _CTRL)
+
+    @property
+    def shift(self) -> bool:
+        """Whether the "Shift" modifier is active."""
+        return bool(self._code & _SHIFT)
+
+    @property
+    def alt(self) -> bool:
+        """Whether the "Alt" modifier is active."""
+        return bool(self._code & _ALT)
+
+    @property
+    def meta(self) -> bool:
+        """Whether the "Meta" modifier is active."""
+        return bool(self._code & _META)
+
+    @property
+    def key(self) -> KeyCode | None:
+        """The key that is pressed (e.g. `KeyCode.A`)."""
+        key = self._code & _KEY_MASK
+        return None if key == _NO_KEY else KeyCode(key)
 
     # def hash_code(self) -> str:
     # used by vscode for caching during keybinding resolution
 
     def is_modifier_key(self) -> bool:
         """Return true if this is a modifier key."""
-        return self.key in (
-            KeyCode.Alt,
-            KeyCode.Shift,
-            KeyCode.Ctrl,
-            KeyCode.Meta,
-            KeyCode.UNKNOWN,
-        )
+        return self.key in _MODIFIER_KEYS
 
     def __str__(self) -> str:
         """Get a normalized string representation (constant to all OSes) of this SimpleKeyBinding."""
-        out = ""
-        if self.ctrl:
-            out += "Ctrl+"
-        if self.shift:
-            out += "Shift+"
-        if self.alt:
-            out += "Alt+"
-        if self.meta:
-            out += "Meta+"
-        if self.key:
-            out += str(self.key)
-        return out
+        return _code_to_str(self._code)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(ctrl={self.ctrl}, shift={self.shift}, "
+            f"alt={self.alt}, meta={self.meta}, key={self.key!r})"
+        )
 
     def __eq__(self, other: Any) -> bool:
         # sourcery skip: remove-unnecessary-cast
@@ -59,59 +134,46 @@ class SimpleKeyBinding(BaseModel):
                     other := SimpleKeyBinding._parse_input(other)
                 ) is None:  # pragma: no cover
                     return NotImplemented
-            except TypeError:  # pragma: no cover  # can happen with pydantic v2
+            except TypeError:
                 return NotImplemented
-        return bool(
-            self.ctrl == other.ctrl
-            and self.shift == other.shift
-            and self.alt == other.alt
-            and self.meta == other.meta
-            and self.key == other.key
-        )
+        return bool(self._code == other._code)
 
     @classmethod
-    def from_str(cls, key_str: str) -> "SimpleKeyBinding":
-        """Parse a string into a SimpleKeyBinding."""
-        mods, remainder = _parse_modifiers(key_str.strip())
-        key = KeyCode.from_string(remainder)
-        return cls(**mods, key=key)
+    def from_str(cls, key_str: str, *, strict: bool = False) -> "SimpleKeyBinding":
+        """Parse a string into a SimpleKeyBinding.
+
+        Unknown key names are parsed as `KeyCode.UNKNOWN`, unless `strict` is True,
+        in which case a `KeyBindingParseError` is raised.
+        """
+        return cls._from_code(_parse_code(key_str, strict))
 
     @classmethod
     def from_int(
         cls, key_int: int, os: OperatingSystem | None = None
     ) -> "SimpleKeyBinding":
         """Create a SimpleKeyBinding from an integer."""
-        ctrl_cmd = bool(key_int & KeyMod.CtrlCmd)
-        win_ctrl = bool(key_int & KeyMod.WinCtrl)
-        shift = bool(key_int & KeyMod.Shift)
-        alt = bool(key_int & KeyMod.Alt)
-
         os = OperatingSystem.current() if os is None else os
-        ctrl = win_ctrl if os.is_mac else ctrl_cmd
-        meta = ctrl_cmd if os.is_mac else win_ctrl
-        key = key_int & 0x000000FF  # keycode mask
-
-        return cls(ctrl=ctrl, shift=shift, alt=alt, meta=meta, key=key)
+        code = int(KeyCode(key_int & 0x000000FF))  # keycode mask
+        if key_int & KeyMod.CtrlCmd:
+            code |= _META if os.is_mac else _CTRL
+        if key_int & KeyMod.WinCtrl:
+            code |= _CTRL if os.is_mac else _META
+        if key_int & KeyMod.Shift:
+            code |= _SHIFT
+        if key_int & KeyMod.Alt:
+            code |= _ALT
+        return cls._from_code(code)
 
     def __int__(self) -> int:
         return int(self.to_int())
 
     def __hash__(self) -> int:
-        return hash((self.ctrl, self.shift, self.alt, self.meta, self.key))
+        return self._code
 
     def to_int(self, os: OperatingSystem | None = None) -> int:
         """Convert this SimpleKeyBinding to an integer representation."""
         os = OperatingSystem.current() if os is None else os
-        mods: KeyMod = KeyMod.NONE
-        if self.ctrl:
-            mods |= KeyMod.WinCtrl if os.is_mac else KeyMod.CtrlCmd
-        if self.shift:
-            mods |= KeyMod.Shift
-        if self.alt:
-            mods |= KeyMod.Alt
-        if self.meta:
-            mods |= KeyMod.CtrlCmd if os.is_mac else KeyMod.WinCtrl
-        return mods | (self.key or 0)
+        return _code_to_int(self._code, os)
 
     def _mods2keycodes(self) -> list[KeyCode]:
         """Create KeyCode instances list of modifiers from this SimpleKeyBinding."""
@@ -142,14 +204,7 @@ class SimpleKeyBinding(BaseModel):
         Also, a join character can be defined. By default `+` is used.
         """
         os = OperatingSystem.current() if os is None else os
-        keybinding_elements = [*self._mods2keycodes()]
-        if self.key:
-            keybinding_elements.append(self.key)
-
-        return joinchar.join(
-            kbe.os_symbol(os=os) if use_symbols else kbe.os_name(os=os)
-            for kbe in keybinding_elements
-        )
+        return _code_to_text(self._code, os, use_symbols, joinchar)
 
     @classmethod
     def _parse_input(cls, v: Any) -> "SimpleKeyBinding":
@@ -159,14 +214,190 @@ class SimpleKeyBinding(BaseModel):
             return cls.from_str(v)
         if isinstance(v, int):
             return cls.from_int(v)
+        if isinstance(v, dict):
+            return cls(**v)
         raise TypeError(f"invalid type: {type(v)}")
 
-    @model_validator(mode="before")
     @classmethod
-    def _model_val(cls, val: "SimpleKeyBinding") -> "SimpleKeyBinding":
-        if not isinstance(val, (SimpleKeyBinding, dict)):
-            return cls._parse_input(val)
-        return val
+    def _validate(cls, v: Any) -> "SimpleKeyBinding":
+        try:
+            return cls._parse_input(v)
+        except TypeError as e:
+            # e.g. unknown fields: pydantic only reports ValueErrors as errors
+            raise ValueError(str(e)) from e
+
+    # pydantic BaseModel API, kept for backwards compatibility
+
+    @classmethod
+    def model_validate(cls, obj: Any) -> "SimpleKeyBinding":
+        """Validate `obj` (a dict, string, int or SimpleKeyBinding)."""
+        return _simple_keybinding_adapter().validate_python(obj)
+
+    def model_dump(self, *, mode: str = "python") -> dict[str, Any]:
+        """Return the fields of this SimpleKeyBinding as a dict."""
+        data = _dump_simple_keybinding(self)
+        if mode == "json" and data["key"] is not None:
+            data["key"] = int(data["key"])
+        return data
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "SimpleKeyBinding":
+        """Return a copy of this SimpleKeyBinding, with fields from `update`."""
+        if not update:
+            return self  # immutable
+        return type(self)(**{**_dump_simple_keybinding(self), **update})
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: type, handler: "GetCoreSchemaHandler"
+    ) -> "core_schema.CoreSchema":
+        from pydantic_core import core_schema
+
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                _dump_simple_keybinding
+            ),
+        )
+
+
+@cache
+def _simple_keybinding_adapter() -> "TypeAdapter[SimpleKeyBinding]":
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(SimpleKeyBinding)
+
+
+def _dump_simple_keybinding(kb: SimpleKeyBinding) -> dict[str, Any]:
+    return {
+        "ctrl": kb.ctrl,
+        "shift": kb.shift,
+        "alt": kb.alt,
+        "meta": kb.meta,
+        "key": kb.key,
+    }
+
+
+class KeyBindingParseError(ValueError):
+    """Error raised when parsing an invalid keybinding string with `strict=True`.
+
+    Attributes
+    ----------
+    string : str
+        The string that was being parsed.
+    position : int
+        Index in `string` at which the error occurred.
+    """
+
+    def __init__(self, msg: str, string: str, position: int) -> None:
+        self.string = string
+        self.position = position
+        super().__init__(
+            f"{msg} at position {position}:\n  {string}\n  {' ' * position}^"
+        )
+
+
+# modifier aliases (lowercase) -> code bit
+_MODIFIER_ALIASES = {
+    **dict.fromkeys(("ctrl", "control", "ctl", "⌃", "^"), _CTRL),
+    **dict.fromkeys(("shift", "⇧"), _SHIFT),
+    **dict.fromkeys(("alt", "opt", "option", "⌥"), _ALT),
+    **dict.fromkeys(
+        ("meta", "super", "win", "windows", "⊞", "cmd", "command", "⌘"), _META
+    ),
+}
+# a single modifier, followed by a separator.  (Longest aliases first, so that the
+# alternation never needs to backtrack.)
+_re_modifier = re.compile(
+    "({})[+|\\-]".format(
+        "|".join(map(re.escape, sorted(_MODIFIER_ALIASES, key=len, reverse=True)))
+    ),
+    re.IGNORECASE,
+)
+_re_part = re.compile(r"\S+")
+
+
+def _parse_part(string: str, start: int, end: int, strict: bool) -> int:
+    """Parse `string[start:end]`, a single part of a keybinding, into a code.
+
+    Modifiers must start at the beginning of the part, and be separated by
+    "+" or "-" (case insensitive).  e.g. "ctrl+shift+alt+K" or "Ctrl-Cmd-K"
+    """
+    code = 0
+    pos = start
+    while m := _re_modifier.match(string, pos, end):
+        code |= _MODIFIER_ALIASES[m[1].lower()]
+        pos = m.end()
+    name = string[pos:end]
+    key = KeyCode.from_string(name)
+    if strict and key == KeyCode.UNKNOWN and name.lower() != "unknown":
+        msg = f"Unknown key {name!r}" if name else "Missing key"
+        raise KeyBindingParseError(msg, string, pos)
+    return code | key
+
+
+@lru_cache(maxsize=4096)
+def _parse_code(key_str: str, strict: bool = False) -> int:
+    stripped = key_str.strip()
+    start = key_str.index(stripped) if stripped else 0
+    return _parse_part(key_str, start, start + len(stripped), strict)
+
+
+@lru_cache(maxsize=4096)
+def _parse_codes(key_str: str, strict: bool = False) -> tuple[int, ...]:
+    parts = tuple(
+        _parse_part(key_str, m.start(), m.end(), strict)
+        for m in _re_part.finditer(key_str)
+    )
+    if strict and not parts:
+        raise KeyBindingParseError("Empty keybinding", key_str, 0)
+    return parts
+
+
+def _code_to_str(code: int) -> str:
+    out = ""
+    if code & _CTRL:
+        out += "Ctrl+"
+    if code & _SHIFT:
+        out += "Shift+"
+    if code & _ALT:
+        out += "Alt+"
+    if code & _META:
+        out += "Meta+"
+    if (key := code & _KEY_MASK) != _NO_KEY and key:
+        out += str(KeyCode(key))
+    return out
+
+
+@cache  # at most 2**12 codes per OS
+def _code_to_int(code: int, os: OperatingSystem) -> int:
+    mods: KeyMod = KeyMod.NONE
+    if code & _CTRL:
+        mods |= KeyMod.WinCtrl if os.is_mac else KeyMod.CtrlCmd
+    if code & _SHIFT:
+        mods |= KeyMod.Shift
+    if code & _ALT:
+        mods |= KeyMod.Alt
+    if code & _META:
+        mods |= KeyMod.CtrlCmd if os.is_mac else KeyMod.WinCtrl
+    key = code & _KEY_MASK
+    return mods | (KeyCode(key) if key not in (_NO_KEY, 0) else 0)
+
+
+@lru_cache(maxsize=4096)
+def _code_to_text(
+    code: int, os: OperatingSystem, use_symbols: bool, joinchar: str
+) -> str:
+    kb = SimpleKeyBinding._from_code(code)
+    keybinding_elements = [*kb._mods2keycodes()]
+    if kb.key:
+        keybinding_elements.append(kb.key)
+
+    return joinchar.join(
+        kbe.os_symbol(os=os) if use_symbols else kbe.os_name(os=os)
+        for kbe in keybinding_elements
+    )
 
 
 MIN1 = {"min_length": 1}
@@ -218,10 +449,15 @@ class KeyBinding:
         return self.parts[0]
 
     @classmethod
-    def from_str(cls, key_str: str) -> "KeyBinding":
-        """Parse a string into a SimpleKeyBinding."""
-        parts = [SimpleKeyBinding.from_str(part) for part in key_str.split()]
-        return cls(parts=parts)
+    def from_str(cls, key_str: str, *, strict: bool = False) -> "KeyBinding":
+        """Parse a string into a KeyBinding.
+
+        Unknown key names are parsed as `KeyCode.UNKNOWN`, unless `strict` is True,
+        in which case a `KeyBindingParseError` is raised (with the position of
+        the error in `key_str`).
+        """
+        codes = _parse_codes(key_str, strict)
+        return cls(parts=[SimpleKeyBinding._from_code(c) for c in codes])
 
     @classmethod
     def from_int(cls, key_int: int, os: OperatingSystem | None = None) -> "KeyBinding":
@@ -300,33 +536,3 @@ class KeyBinding:
         if isinstance(v, str):
             return cls.from_str(v)
         raise TypeError("invalid keybinding")  # pragma: no cover
-
-
-_re_ctrl = re.compile(r"(ctrl|control|ctl|⌃|\^)[\+|\-]")
-_re_shift = re.compile(r"(shift|⇧)[\+|\-]")
-_re_alt = re.compile(r"(alt|opt|option|⌥)[\+|\-]")
-_re_meta = re.compile(r"(meta|super|win|windows|⊞|cmd|command|⌘)[\+|\-]")
-
-
-def _parse_modifiers(input: str) -> tuple[dict[str, bool], str]:
-    """Parse modifiers from a string (case insensitive).
-
-    modifiers must start at the beginning of the string, and be separated by
-    "+" or "-".  e.g. "ctrl+shift+alt+K" or "Ctrl-Cmd-K"
-    """
-    remainder = input.lower()
-
-    patterns = {"ctrl": _re_ctrl, "shift": _re_shift, "alt": _re_alt, "meta": _re_meta}
-    mods = dict.fromkeys(patterns, False)
-    while True:
-        saw_modifier = False
-        for key, ptrn in patterns.items():
-            if m := ptrn.match(remainder):
-                remainder = remainder[m.span()[1] :]
-                mods[key] = True
-                saw_modifier = True
-                break
-        if not saw_modifier:
-            break
-
-    return mods, remainder
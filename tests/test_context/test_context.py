@@ -145,3 +145,71 @@ def test_context_events() -> None:
     mock4.reset_mock()
     root3e["e"] = 1
     assert mock4.call_args[0][0] == {"e"}
+
+
+def test_derived_keys() -> None:
+    ctx = Context({"selection": []})
+    calls: list[str] = []
+
+    def _layer_type(selection: list) -> str | None:
+        calls.append("layer_type")
+        return selection[-1] if selection else None
+
+    def _tool_ok(layer_type: str | None) -> bool:
+        calls.append("tool_ok")
+        return layer_type == "image"
+
+    # registered out of order: ordering comes from the dependency graph
+    ctx.add_derived("tool_ok", _tool_ok, ["layer_type"])
+    ctx.add_derived("layer_type", _layer_type, ["selection"])
+    assert ctx["layer_type"] is None
+    assert ctx["tool_ok"] is False
+
+    mock = Mock()
+    ctx.changed.connect(mock)
+    calls.clear()
+    ctx["selection"] = ["image"]
+    # one event for the whole chain, each key computed once, in order
+    mock.assert_called_once_with({"selection", "layer_type", "tool_ok"})
+    assert calls == ["layer_type", "tool_ok"]
+    assert ctx["tool_ok"] is True
+
+    # downstream keys are skipped when an upstream value doesn't change
+    mock.reset_mock()
+    calls.clear()
+    ctx["selection"] = ["labels", "image"]
+    mock.assert_called_once_with({"selection"})
+    assert calls == ["layer_type"]
+
+    # child contexts propagate parent changes to their own derived keys
+    child = ctx.new_child()
+    child.add_derived("n_selected", len, ["selection"])
+    child_mock = Mock()
+    child.changed.connect(child_mock)
+    ctx["selection"] = []
+    child_mock.assert_called_once_with(
+        {"selection", "layer_type", "tool_ok", "n_selected"}
+    )
+    assert child["n_selected"] == 0
+
+    with pytest.raises(ValueError, match="already derived"):
+        ctx.add_derived("tool_ok", _tool_ok)
+    with pytest.raises(ValueError, match="Circular dependency"):
+        ctx.add_derived("selection", len, ["tool_ok"])
+    assert "selection" not in ctx._derived
+    with pytest.raises(KeyError, match="not a derived context key"):
+        ctx.invalidate("selection")
+
+    # lazy keys are only computed when read
+    external = {"value": 1}
+    dispose = ctx.add_derived("ext", lambda: external["value"], lazy=True)
+    assert ctx["ext"] == 1
+    external["value"] = 2
+    assert ctx["ext"] == 1
+    mock.reset_mock()
+    ctx.invalidate("ext")
+    mock.assert_called_once_with({"ext"})
+    ctx.invalidate("ext")  # still unread, not reported again
+    mock.assert_called_once()
+    dispose()
+    assert ctx["ext"] == 2
@@ -65,3 +65,164 @@ def test_good_naming() -> None:
         # it's attribute name
         class Ns(ContextNamespace):
             my_key = ContextKey(id="not_my_key")  # type: ignore
+
+
+def test_computed_keys() -> None:
+    from psygnal import Signal
+
+    from app_model.expressions import Context
+
+    class Source:
+        changed = Signal()
+
+        def __init__(self) -> None:
+            self.items: list[int] = []
+
+    n_calls = {"total": 0}
+
+    def _total(src: Source) -> int:
+        n_calls["total"] += 1
+        return sum(src.items)
+
+    class Ns(ContextNamespace[Source]):
+        scale = ContextKey(1, "a plain key")
+        n_items = ContextKey(
+            0, "number of items", lambda s: len(s.items), depends_on=()
+        )
+        total = ContextKey(0, "sum of items", _total, depends_on=[scale])
+
+    src = Source()
+    ctx = Context()
+    ns = Ns(ctx, source=src)
+    ns.watch(src.changed, ["n_items"])
+
+    # nothing is computed until the key is read
+    assert n_calls["total"] == 0
+    assert ns.total == 0
+    assert ctx["total"] == 0
+    assert n_calls["total"] == 1
+
+    # source changes are only seen after invalidation
+    assert ctx["n_items"] == 0
+    src.items.extend([1, 2])
+    assert ctx["n_items"] == 0
+    with pytest.raises(KeyError, match="not a computed key"):
+        ns.invalidate("scale")
+    events: list[set] = []
+    ctx.changed.connect(events.append)
+    src.changed.emit()
+    assert events == [{"n_items"}]
+    assert (Ns.n_items == 2).eval(ctx)
+
+    # changing a dependency invalidates the cached value, computed once on read
+    events.clear()
+    ns.scale = 2
+    assert events == [{"scale", "total"}]
+    assert n_calls["total"] == 1
+    assert ctx["total"] == 3
+    assert ctx["total"] == 3
+    assert n_calls["total"] == 2
+
+    # keys that are already stale don't emit again
+    events.clear()
+    ns.scale = 3
+    ns.scale = 4
+    assert events == [{"scale", "total"}, {"scale"}]
+
+    # child contexts see computed values too
+    child = ctx.new_child()
+    assert child["total"] == 3
+    assert n_calls["total"] == 3
+
+    # computed keys can be overridden, and reset recomputes them
+    ns.total = 100
+    assert ctx["total"] == 100
+    ns.reset("total")
+    assert ctx["total"] == 3
+
+
+def test_namespace_dispose() -> None:
+    from psygnal import Signal
+
+    from app_model.expressions import Context
+
+    class Source:
+        changed = Signal()
+
+        def __init__(self, items: list[int]) -> None:
+            self.items = items
+
+    class Ns(ContextNamespace[Source]):
+        n_items = ContextKey(
+            0, "number of items", lambda s: len(s.items), depends_on=()
+        )
+
+    ctx = Context()
+    src = Source([1])
+    ns = Ns(ctx, source=src)
+    ns.watch(src.changed)
+    # computed keys are derived under their context id
+    assert Ns.n_items.id in ctx._derived
+    assert ctx[Ns.n_items.id] == 1
+
+    ns.dispose()
+    assert Ns.n_items.id not in ctx._derived
+    assert ctx["n_items"] == 1  # the last value is kept
+    src.items.append(2)
+    src.changed.emit()  # no longer watched
+    assert ctx["n_items"] == 1
+    with pytest.raises(KeyError, match="not a computed key"):
+        ns.invalidate("n_items")
+    ns.dispose()  # disposing again is a no-op
+
+    # another namespace can then compute the keys, e.g. from a new source
+    ns2 = Ns(ctx, source=Source([1, 2, 3]))
+    assert ctx["n_items"] == 3
+    with pytest.raises(ValueError, match="already derived"):
+        Ns(ctx, source=src)
+    ns2.dispose()
+
+    # invalidating a namespace with no computed keys leaves other keys alone
+    dispose_other = ctx.add_derived("other", lambda: 1, lazy=True)
+    assert ctx["other"] == 1
+    events: list[set] = []
+    ctx.changed.connect(events.append)
+    ns.invalidate()
+    ns2.invalidate()
+    assert not events
+    dispose_other()
+
+    # a namespace failing halfway through doesn't leave keys derived
+    class Ns2(ContextNamespace[Source]):
+        first = ContextKey(0, "first item", lambda s: s.items[0], depends_on=())
+        n_items = ContextKey(
+            0, "number of items", lambda s: len(s.items), depends_on=()
+        )
+
+    ns3 = Ns(ctx, source=src)
+    with pytest.raises(ValueError, match="already derived"):
+        Ns2(ctx, source=src)
+    assert "first" not in ctx._derived
+    ns3.dispose()
+    ns4 = Ns2(ctx, source=src)
+    assert ctx["first"] == 1
+    ns4.dispose()
+
+
+def test_computed_keys_plain_mapping() -> None:
+    class Ns(ContextNamespace[list]):
+        length = ContextKey(0, "length", len, depends_on=())
+
+    items = [1, 2, 3]
+    ctx: dict = {}
+    ns = Ns(ctx, source=items)
+    # without a `Context`, computed keys are evaluated eagerly
+    assert ctx["length"] == 3
+    items.append(4)
+    ns.invalidate()
+    assert ctx["length"] == 4
+
+    # without a source, getters are not called
+    ctx2: dict = {}
+    Ns(ctx2)
+    assert ctx2["length"] == 0
@@ -6,6 +6,7 @@ from pydantic import BaseModel
 
 from app_model.types import (
     KeyBinding,
+    KeyBindingParseError,
     KeyBindingRule,
     KeyCode,
     KeyMod,
@@ -135,6 +136,22 @@ def test_keybinding_parser(key: str) -> None:
     assert str(KeyBinding.from_str(key)) == "Ctrl+Shift+Alt+Meta+A"
 
 
+@pytest.mark.parametrize(
+    ("key_str", "position"),
+    [("Ctrl+Foo", 5), ("Ctrl+", 5), ("", 0), ("Ctrl+A Shift+Qux", 13)],
+)
+def test_keybinding_parser_strict(key_str: str, position: int) -> None:
+    # lenient parsing falls back to KeyCode.UNKNOWN
+    KeyBinding.from_str(key_str)
+    with pytest.raises(KeyBindingParseError) as e:
+        KeyBinding.from_str(key_str, strict=True)
+    assert e.value.position == position
+    assert e.value.string == key_str
+    assert KeyBinding.from_str(" Cmd-⇧-a  ⌃+9 ", strict=True) == KeyBinding.from_str(
+        "Meta+Shift+A Ctrl+9"
+    )
+
+
 def test_chord_keybinding() -> None:
     kb = KeyBinding.from_str("Shift+A Cmd+9")
     assert len(kb) == 2
@@ -174,6 +191,53 @@ def test_in_dict() -> None:
         kbs[new_a]
 
 
+def test_simple_keybinding_immutable() -> None:
+    import pickle
+
+    kb = SimpleKeyBinding(ctrl=True, key=KeyCode.KeyA)
+    assert kb.ctrl and not kb.shift and kb.key == KeyCode.KeyA
+    assert SimpleKeyBinding().key is None
+    with pytest.raises(AttributeError):
+        kb.shift = True  # type: ignore [misc]
+    assert "ctrl=True" in repr(kb)
+    assert pickle.loads(pickle.dumps(kb)) == kb
+    assert hash(SimpleKeyBinding.from_str("Ctrl+A")) == hash(kb)
+    # parsing is cached, but returns distinct objects
+    assert KeyBinding.from_str("Ctrl+A B") is not KeyBinding.from_str("Ctrl+A B")
+
+    class M(BaseModel):
+        key: SimpleKeyBinding
+
+    m = M(key={"ctrl": True, "key": KeyCode.KeyA})
+    assert m.key == kb
+    assert M(key="Ctrl+A").key == kb
+    assert M(**m.model_dump()).key == kb
+
+
+def test_simple_keybinding_model_api() -> None:
+    from pydantic import ValidationError
+
+    kb = SimpleKeyBinding(ctrl=True, key=KeyCode.KeyA)
+    assert SimpleKeyBinding(ctrl=True, key="A") == kb
+    assert SimpleKeyBinding(ctrl=True, key=int(KeyCode.KeyA)) == kb
+    assert SimpleKeyBinding.model_validate({"key": "A", "ctrl": True}) == kb
+    assert SimpleKeyBinding.model_validate(kb.model_dump()) == kb
+    assert kb.model_dump(mode="json")["key"] == int(KeyCode.KeyA)
+    assert kb.model_copy(update={"shift": True}) == SimpleKeyBinding.from_str(
+        "Ctrl+Shift+A"
+    )
+    assert kb.model_copy() == kb
+
+    class M(BaseModel):
+        key: SimpleKeyBinding
+
+    for bad in ({"key": "A", "unknown": True}, {"key": []}, 1.5):
+        with pytest.raises(ValidationError):
+            M(key=bad)
+        with pytest.raises(ValidationError):
+            SimpleKeyBinding.model_validate(bad)
+
+
 def test_in_model() -> None:
     class M(BaseModel):
         key: KeyBinding
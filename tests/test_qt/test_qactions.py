@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -7,9 +7,11 @@ from app_model.backends.qt import QCommandRuleAction, QMenuItemAction
 from app_model.types import (
     Action,
     CommandRule,
+    KeyBinding,
     KeyBindingRule,
     KeyBindingSource,
     KeyCode,
+    KeyMod,
     MenuItem,
     ToggleRule,
 )
@@ -164,3 +166,96 @@ def test_update_keybinding_in_tooltip(
     dispose1()
     q_action._update_keybinding()
     assert q_action.toolTip() == "Initial tooltip"
+
+
+@pytest.mark.usefixtures("qapp")
+def test_keymap_updates_shortcuts(simple_app: "Application") -> None:
+    for id_ in ("test.keymap.a", "test.keymap.b"):
+        simple_app.register_action(
+            Action(
+                id=id_,
+                title=id_,
+                callback=lambda: None,
+                keybindings=[KeyBindingRule(primary=KeyCode.KeyA)],
+                menus=[{"id": "test_keymap_menu"}],
+            )
+        )
+    menu_items = list(simple_app.menus.get_menu("test_keymap_menu"))
+    a, b = (QMenuItemAction.create(item, simple_app) for item in menu_items)
+    assert a.toolTip() == "test.keymap.a (A)"
+
+    keybindings = simple_app.keybindings
+    with (
+        patch.object(QMenuItemAction, "_apply_keybinding") as mock,
+        patch.object(
+            keybindings, "get_keybinding", wraps=keybindings.get_keybinding
+        ) as get_kb,
+    ):
+        dispose = keybindings.load_keymap(
+            [{"key": "Ctrl+K", "command": "test.keymap.a"}]
+        )
+    # only the actions of the affected commands are updated
+    assert mock.call_count == 1
+    get_kb.assert_called_once_with("test.keymap.a")
+    dispose()
+
+    # switching layers resolves all keybindings once, for all actions
+    keybindings.load_keymap([{"key": "B", "command": "test.keymap.b", "layer": "l"}])
+    with patch.object(
+        keybindings,
+        "get_command_keybindings",
+        wraps=keybindings.get_command_keybindings,
+    ) as get_all:
+        keybindings.push_layer("l")
+    get_all.assert_called_once()
+    assert b.toolTip() == "test.keymap.b (B)"
+    keybindings.pop_layer()
+    assert b.toolTip() == "test.keymap.b (A)"
+
+    dispose = simple_app.keybindings.load_keymap(
+        [{"key": "Ctrl+K", "command": "test.keymap.a"}]
+    )
+    kb = simple_app.keybindings.get_keybinding("test.keymap.a")
+    assert kb and kb.keybinding.to_text() in a.toolTip()
+    assert a.shortcut() != b.shortcut()
+    dispose()
+    assert a.toolTip() == "test.keymap.a (A)"
+    assert a.shortcut() == b.shortcut()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_keybinding_sequence_cache(simple_app: "Application") -> None:
+    from app_model.backends.qt._qkeymap import keybinding_sequence
+
+    action = Action(
+        id="test.sequence.cache",
+        title="Test",
+        callback=lambda: None,
+        keybindings=[KeyBindingRule(primary=KeyMod.CtrlCmd | KeyCode.KeyK)],
+    )
+    simple_app.register_action(action)
+    q_action = QCommandRuleAction(action, simple_app)
+    kb = simple_app.keybindings.get_keybinding("test.sequence.cache")
+    assert kb
+    sequence, text = keybinding_sequence(kb.keybinding)
+    assert keybinding_sequence(KeyBinding.validate(int(kb.keybinding)))[0] is sequence
+    assert q_action.shortcut() == sequence
+    assert text in q_action.toolTip()
+
+    # an unchanged keybinding is not re-applied
+    with patch.object(q_action, "setShortcut") as mock:
+        q_action._update_keybinding()
+    mock.assert_not_called()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_qicon_cache() -> None:
+    from app_model.backends.qt import clear_qicon_cache, to_qicon
+    from app_model.types import Icon
+
+    icon = Icon(dark="fa6s.arrow_down", light="fa6s.arrow_up")
+    assert to_qicon(icon) is to_qicon(Icon(dark="fa6s.arrow_down"))
+    assert to_qicon(icon, "light") is not to_qicon(icon)
+    cached = to_qicon(icon)
+    clear_qicon_cache()
+    assert to_qicon(icon) is not cached
@@ -2,17 +2,19 @@
 # pyright: reportOperatorIssue=false
 from unittest.mock import patch
 
-from qtpy.QtCore import Qt
+import pytest
+from qtpy.QtCore import QKeyCombination, Qt
 from qtpy.QtGui import QKeySequence
 
 from app_model.backends.qt import (
     _qkeymap,
     qkey2modelkey,
+    qkeyint2modelint,
     qkeysequence2modelkeybinding,
     qmods2modelmods,
 )
 from app_model.backends.qt._qkeymap import modelkey2qkey
-from app_model.types import KeyBinding, KeyCode, KeyCombo, KeyMod
+from app_model.types import KeyBinding, KeyCode, KeyCombo, KeyMod, SimpleKeyBinding
 
 # stuff we don't know how to deal with yet
 
@@ -166,3 +168,31 @@ def test_qkeysequence2modelkeybinding() -> None:
             parts=[KeyMod.WinCtrl | KeyCode.Meta, KeyMod.CtrlCmd | KeyCode.Ctrl]
         )
         assert qkeysequence2modelkeybinding(seq) == app_key
+
+
+@pytest.mark.parametrize(
+    ("mac", "swapped"), [(False, False), (True, False), (True, True)]
+)
+def test_qkeyint2modelint(mac: bool, swapped: bool) -> None:
+    mods = [
+        Qt.KeyboardModifier.NoModifier,
+        Qt.KeyboardModifier.ShiftModifier,
+        Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.AltModifier,
+        Qt.KeyboardModifier.MetaModifier | Qt.KeyboardModifier.KeypadModifier,
+    ]
+    with (
+        patch.object(_qkeymap, "MAC", mac),
+        patch.object(_qkeymap, "_mac_ctrl_meta_swapped", return_value=swapped),
+    ):
+        # the precomputed tables agree with the per-key translation functions
+        for qkey in _qkeymap.KEY_FROM_QT:
+            if _qkeymap._qint(qkey) & ~0x01FFFFFF:
+                continue  # keypad keys are only reachable via the Qt-key lookups
+            for qmod in mods:
+                combo = QKeyCombination(qmod, Qt.Key(qkey))
+                expected = qmods2modelmods(qmod) | qkey2modelkey(Qt.Key(qkey))
+                assert qkeyint2modelint(combo.toCombined()) == expected
+        for keycode in KeyCode:
+            skb = SimpleKeyBinding(ctrl=True, shift=True, key=keycode)
+            qint = _qkeymap.simple_keybinding_to_qint(skb)
+            assert qint & ~0x1E000000 == _qkeymap._qint(modelkey2qkey(keycode))
@@ -7,7 +7,7 @@ import pytest
 from qtpy.QtCore import Qt
 from qtpy.QtWidgets import QAction, QMainWindow
 
-from app_model.backends.qt import QModelMenu, QModelToolBar
+from app_model.backends.qt import QModelMenu, QModelMenuBar, QModelToolBar
 
 if TYPE_CHECKING:
     from pytestqt.plugin import QtBot
@@ -175,3 +175,135 @@ def test_menu_events(
 
     menu_texts = [a.text() for a in menu.actions()]
     assert menu_texts == ["AtTop", SEP, "Undo", "Redo", SEP, "Paste"]
+
+
+def test_menu_incremental_rebuild(qtbot: QtBot, full_app: FullApp) -> None:
+    app = full_app
+    menu = QModelMenu(app.Menus.FILE, app)
+    qtbot.addWidget(menu)
+    before = menu.actions()
+    submenu = menu.findChild(QModelMenu, app.Menus.FILE_OPEN_FROM)
+    assert submenu
+
+    # adding an item keeps (and reuses) the existing actions and submenus
+    dispose = app.menus.append_menu_items(
+        [(app.Menus.FILE, {"command": {"id": "new", "title": "New"}, "group": "z"})]
+    )
+    after = menu.actions()
+    assert [a.text() for a in after] == ["Open From...", "Open...", SEP, "New"]
+    assert after[:2] == before
+    assert menu.findChild(QModelMenu, app.Menus.FILE_OPEN_FROM) is submenu
+
+    dispose()
+    assert menu.actions() == before
+
+    # removed submenus are disposed of
+    dispose = app.menus.append_menu_items(
+        [(app.Menus.FILE, {"submenu": "file/extra", "title": "Extra", "group": "z"})]
+    )
+    extra = menu.findChild(QModelMenu, "file/extra")
+    assert extra
+    assert [a.text() for a in menu.actions()] == [
+        "Open From...",
+        "Open...",
+        SEP,
+        "Extra",
+    ]
+    with qtbot.waitSignal(extra.destroyed):
+        dispose()
+    assert menu.actions() == before
+
+
+def test_submenu_shortcut(qtbot: QtBot, full_app: FullApp) -> None:
+    from qtpy.QtWidgets import QWidget
+
+    from app_model.types import KeyBindingRule, KeyCode, KeyMod
+
+    app = full_app
+    app.keybindings.register_keybinding_rule(
+        app.Commands.OPEN_FROM_A, KeyBindingRule(primary=KeyMod.CtrlCmd | KeyCode.KeyJ)
+    )
+    win = QMainWindow()
+    qtbot.addWidget(win)
+    win.setMenuBar(QModelMenuBar([app.Menus.FILE], app))
+    central = QWidget()
+    central.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+    win.setCentralWidget(central)
+    win.show()
+    with qtbot.waitActive(win):
+        win.activateWindow()
+    central.setFocus()
+
+    # the shortcut of a submenu item works before the submenu is ever shown
+    qtbot.keyClick(central, Qt.Key.Key_J, Qt.KeyboardModifier.ControlModifier)
+    app.mocks.open_from_a.assert_called_once()
+
+
+def test_lazy_submenu(qtbot: QtBot, full_app: FullApp) -> None:
+    app = full_app
+    menu = QModelMenu(app.Menus.FILE, app, lazy_submenus=True)
+    qtbot.addWidget(menu)
+    submenu = menu.findChild(QModelMenu, app.Menus.FILE_OPEN_FROM)
+    assert isinstance(submenu, QModelMenu)
+    # submenus are only populated when first shown
+    assert not submenu.actions()
+    app.menus.menus_changed.emit({app.Menus.FILE_OPEN_FROM})
+    assert not submenu.actions()
+
+    menu.update_from_context({"something_open": False, "friday": True, "sat": False})
+    submenu.aboutToShow.emit()
+    action = submenu.findAction(app.Commands.OPEN_FROM_B)
+    assert action
+    # the last context is applied to the newly created actions
+    assert not action.isEnabled()
+
+
+def test_menu_follow_context(qtbot: QtBot, full_app: FullApp) -> None:
+    app = full_app
+    ctx = app.context
+    ctx.update({"allow_undo_redo": True, "something_to_undo": False})
+    menubar = QModelMenuBar([app.Menus.EDIT, app.Menus.FILE], app, follow_context=True)
+    qtbot.addWidget(menubar)
+    edit = menubar.findChild(QModelMenu, app.Menus.EDIT)
+    redo = edit.findAction(app.Commands.REDO)
+    assert redo.isEnabled() and redo.isVisible()
+
+    ctx["allow_undo_redo"] = False
+    assert not redo.isEnabled()
+    ctx["something_to_undo"] = True
+    assert not redo.isVisible()
+
+    # submenus follow the context too, including once they are (lazily) built
+    submenu = menubar.findChild(QModelMenu, app.Menus.FILE_OPEN_FROM)
+    ctx.update({"friday": False, "sat": False})
+    assert not submenu.isEnabled()
+    action = submenu.findAction(app.Commands.OPEN_FROM_B)
+    assert not action.isEnabled()
+    ctx["sat"] = True
+    assert action.isEnabled()
+    ctx["friday"] = True
+    assert submenu.isEnabled()
+
+
+def test_find_action_index(qtbot: QtBot, full_app: FullApp) -> None:
+    app = full_app
+    menubar = QModelMenuBar([app.Menus.EDIT, app.Menus.FILE], app)
+    qtbot.addWidget(menubar)
+    edit = menubar.findChild(QModelMenu, app.Menus.EDIT)
+    copy = edit.findAction(app.Commands.COPY)
+    assert copy is not None
+    assert menubar.findAction(app.Commands.COPY) is copy
+
+    # actions in submenus are found recursively
+    file = menubar.findChild(QModelMenu, app.Menus.FILE)
+    assert file.findAction(app.Commands.OPEN_FROM_B) is None
+    from_b = file.findAction(app.Commands.OPEN_FROM_B, recursive=True)
+    assert from_b is not None
+    assert menubar.findAction(app.Commands.OPEN_FROM_B) is from_b
+    assert menubar.findAction("missing") is None
+
+    # the index follows actions added and removed outside of a rebuild
+    edit.removeAction(copy)
+    assert edit.findAction(app.Commands.COPY) is None
+    edit.addAction(copy)
+    assert edit.findAction(app.Commands.COPY) is copy
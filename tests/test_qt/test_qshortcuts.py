@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from qtpy.QtCore import QEvent, Qt
+from qtpy.QtGui import QKeyEvent
+from qtpy.QtWidgets import QWidget
+
+from app_model.backends.qt import QModelShortcutDispatcher
+from app_model.types import KeyBindingRule, KeyChord, KeyCode, KeyMod
+
+if TYPE_CHECKING:
+    import pytest
+    from pytestqt.plugin import QtBot
+
+    from conftest import FullApp
+
+CTRL = Qt.KeyboardModifier.ControlModifier
+
+
+def _press(
+    dispatcher: QModelShortcutDispatcher, widget: QWidget, key: Qt.Key
+) -> tuple[bool, bool]:
+    """Send shortcut override and key press events, return whether handled."""
+    override = QKeyEvent(QEvent.Type.ShortcutOverride, key, CTRL)
+    press = QKeyEvent(QEvent.Type.KeyPress, key, CTRL)
+    return dispatcher.eventFilter(widget, override), dispatcher.eventFilter(
+        widget, press
+    )
+
+
+def test_shortcut_dispatcher(
+    qtbot: QtBot, full_app: FullApp, caplog: pytest.LogCaptureFixture
+) -> None:
+    app = full_app
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    dispatcher = QModelShortcutDispatcher(app)
+    dispatcher.install()
+
+    # bound and enabled: the command is executed and the key press swallowed
+    assert _press(dispatcher, widget, Qt.Key.Key_C) == (True, True)
+    app.mocks.copy.assert_called_once()
+
+    # bound but disabled by its `when` clause: QAction shortcuts are blocked,
+    # but the key press is delivered to the widget
+    app.context["allow_undo_redo"] = False
+    assert _press(dispatcher, widget, Qt.Key.Key_Z) == (True, False)
+    app.mocks.undo.assert_not_called()
+
+    # errors in the command are logged, not raised into Qt's event dispatch
+    app.mocks.copy.side_effect = RuntimeError("copy failed")
+    assert _press(dispatcher, widget, Qt.Key.Key_C) == (True, True)
+    assert app.mocks.copy.call_count == 2
+    assert "Error executing command" in caplog.text
+    assert "copy failed" in caplog.text
+
+    # unbound keys are ignored
+    assert _press(dispatcher, widget, Qt.Key.Key_J) == (False, False)
+
+    # chords
+    app.keybindings.register_keybinding_rule(
+        app.Commands.OPEN,
+        KeyBindingRule(
+            primary=KeyChord(
+                KeyMod.CtrlCmd | KeyCode.KeyK, KeyMod.CtrlCmd | KeyCode.KeyO
+            )
+        ),
+    )
+    assert _press(dispatcher, widget, Qt.Key.Key_K) == (True, True)
+    assert dispatcher.pending
+    app.mocks.open.assert_not_called()
+    assert _press(dispatcher, widget, Qt.Key.Key_O) == (True, True)
+    app.mocks.open.assert_called_once()
+    assert not dispatcher.pending
+
+    dispatcher.uninstall()
@@ -1,13 +1,25 @@
 # mypy: disable-error-code="var-annotated"
+import json
+from unittest.mock import patch
+
 import pytest
 
-from app_model.registries import KeyBindingsRegistry, MenusRegistry
+from app_model.registries import (
+    CommandPaletteIndex,
+    KeyBindingDispatcher,
+    KeyBindingsRegistry,
+    MenusRegistry,
+    ResolvedMenuItem,
+    ResolvedSubmenu,
+)
 from app_model.registries._keybindings_reg import _RegisteredKeyBinding
 from app_model.types import (
     Action,
+    CommandRule,
     KeyBinding,
     KeyBindingRule,
     KeyBindingSource,
+    KeyChord,
     KeyCode,
     KeyMod,
     MenuItem,
@@ -29,11 +41,485 @@ def test_menus_registry() -> None:
     assert "Sub" in str(reg)  # ok to change
 
 
+def test_append_action_menus() -> None:
+    reg = MenusRegistry()
+    action = Action(
+        id="cmd", title="Cmd", callback=_noop, menus=["a", {"id": "b", "group": "g"}]
+    )
+    reg.append_action_menus(action)
+    (item_a,) = reg.get_menu("a")
+    (item_b,) = reg.get_menu("b")
+    (palette_item,) = reg.get_menu(reg.COMMAND_PALETTE_ID)
+    assert isinstance(item_b, MenuItem)
+    assert item_a.command is item_b.command is palette_item.command
+    assert type(item_a.command) is CommandRule
+    assert item_b == MenuItem(command=action, group="g")
+
+
+def test_menus_dispose_owner() -> None:
+    reg = MenusRegistry()
+    changes: list = []
+    reg.menus_changed.connect(changes.append)
+    placements: list = []
+    reg.placements_changed.connect(placements.append)
+    keep = {"command": {"id": "keep", "title": "Keep"}}
+    reg.append_menu_items([("file", keep)])
+    reg.append_menu_items(
+        [("file", {"command": {"id": "a", "title": "A"}}), ("edit", keep)],
+        owner="plugin",
+    )
+    dispose = reg.append_menu_items(
+        [("plugin_menu", {"command": {"id": "b", "title": "B"}})], owner="plugin"
+    )
+    action = Action(id="c", title="C", callback=_noop, menus=["file"])
+    reg.append_action_menus(action, owner="plugin")
+    assert len(reg.get_menu("file")) == 3
+
+    dispose()
+    assert "plugin_menu" not in reg
+    changes.clear()
+    placements.clear()
+    reg.dispose_owner("plugin")
+    assert changes == [{"file", "edit", reg.COMMAND_PALETTE_ID}]
+    assert placements == [{"a", "keep", "c"}]
+    assert [i.command.id for i in reg.get_menu("file")] == ["keep"]
+    assert "edit" not in reg
+    assert not reg._owned
+
+    reg.dispose_owner("plugin")  # no-op
+    assert len(changes) == 1
+
+
+def test_menus_command_placements() -> None:
+    reg = MenusRegistry()
+    action = Action(id="cmd", title="Cmd", callback=_noop, menus=["file", "edit"])
+    dispose = reg.append_action_menus(action)
+    alt_item = {
+        "command": {"id": "other", "title": "O"},
+        "alt": {"id": "cmd", "title": "C"},
+    }
+    dispose_alt = reg.append_menu_items(
+        [("file", alt_item), ("file", {"submenu": "sub", "title": "Sub"})]
+    )
+    placements = reg.get_command_placements("cmd")
+    assert set(placements) == {"file", "edit", reg.COMMAND_PALETTE_ID}
+    assert len(placements["file"]) == 2
+    assert reg.get_command_placements("other") == {"file": reg.get_menu("file")[1:2]}
+    assert reg.get_command_placements("missing") == {}
+
+    assert dispose
+    dispose()
+    assert set(reg.get_command_placements("cmd")) == {"file"}
+    dispose_alt()
+    assert not reg._command_index
+
+
+def test_menus_resolve_menu() -> None:
+    from app_model.expressions import parse_expression
+
+    reg = MenusRegistry()
+    enablement = parse_expression("ready")
+    action = Action(
+        id="cmd",
+        title="Cmd",
+        callback=_noop,
+        enablement=enablement,
+        toggled="checked",
+        menus=[{"id": "sub", "group": "1"}],
+    )
+    reg.append_action_menus(action)
+    reg.append_menu_items(
+        [
+            ("root", {"command": {"id": "a", "title": "A"}, "group": "2"}),
+            ("root", {"submenu": "sub", "title": "Sub", "group": "1"}),
+            ("root", {"submenu": "hidden", "title": "H", "when": "show_hidden"}),
+            ("hidden", {"submenu": "root", "title": "Cycle"}),
+        ]
+    )
+    # `show_hidden` is false, so the (cyclic) hidden subtree is never evaluated
+    ctx = {"ready": False, "checked": True, "show_hidden": False}
+    groups = reg.resolve_menu("root", ctx)
+    assert [[type(n).__name__ for n in g] for g in groups] == [
+        ["ResolvedSubmenu"],
+        ["ResolvedMenuItem"],
+    ]
+    submenu = groups[0][0]
+    assert isinstance(submenu, ResolvedSubmenu)
+    assert submenu.enabled
+    assert submenu.groups == [
+        [ResolvedMenuItem(reg.get_menu("sub")[0], enabled=False, toggled=True)]
+    ]
+    assert groups[1][0].enabled and groups[1][0].toggled is None  # type: ignore
+    assert reg.resolve_menu("missing", ctx) == []
+
+    with pytest.raises(ValueError, match="root -> hidden -> root"):
+        reg.resolve_menu("root", {**ctx, "show_hidden": True})
+
+
+def test_command_palette_index() -> None:
+    from app_model.expressions import parse_expression
+
+    menus, keybindings = MenusRegistry(), KeyBindingsRegistry()
+    index = CommandPaletteIndex(menus, keybindings)
+    assert not index.search("")
+
+    open_file = Action(id="open", title="Open File", category="File", callback=_noop)
+    menus.append_action_menus(open_file)
+    dispose = menus.append_action_menus(
+        Action(
+            id="fmt",
+            title="Format Document",
+            callback=_noop,
+            enablement=parse_expression("editing"),
+        )
+    )
+    assert len(index) == 2
+    assert [m.item.command.id for m in index.search("fi")] == ["open"]
+    (match,) = index.search("FiOpFi")
+    assert match.text == "File: Open File"
+    assert match.highlights == ((0, 2), (6, 8), (11, 13))
+    assert not index.search("FiOpFiz")
+    # candidates are narrowed by the previous query, and restored when it changes
+    assert [m.item.command.id for m in index.search("f")] == ["open", "fmt"]
+    assert [m.item.command.id for m in index.search("fd")] == ["fmt"]
+    assert index.search("fd", {"editing": False}) == []
+
+    # palette items are followed incrementally (without rescanning the palette)
+    with patch.object(index, "_palette_items") as mock:
+        dispose_alt = menus.append_menu_items(
+            [
+                (
+                    menus.COMMAND_PALETTE_ID,
+                    {
+                        "command": {"id": "alt", "title": "Alternative"},
+                        "alt": {"id": "open", "title": "Open"},
+                    },
+                ),
+                ("other", {"command": {"id": "open", "title": "Open"}}),
+            ]
+        )
+        assert [m.item.command.id for m in index.search("alt")] == ["alt"]
+        dispose_alt()
+        assert len(index) == 2
+    mock.assert_not_called()
+
+    # keybindings are searchable, and followed incrementally (without rescanning
+    # the keybindings of all commands)
+    with patch.object(keybindings, "get_command_keybindings") as mock:
+        dispose_kb = keybindings.register_keybinding_rule(
+            "fmt", KeyBindingRule(primary=KeyMod.Shift | KeyCode.KeyF)
+        )
+    mock.assert_not_called()
+    assert [m.text for m in index.search("shift")] == ["Shift+F"]
+    assert dispose_kb
+    dispose_kb()
+    assert not index.search("shift")
+
+    assert dispose
+    dispose()
+    assert len(index) == 1
+    assert [m.item.command.id for m in index.search("", limit=1)] == ["open"]
+    index.dispose()
+    menus.append_action_menus(Action(id="x", title="X", callback=_noop))
+    assert len(index) == 1
+
+
 def test_keybindings_registry() -> None:
     reg = KeyBindingsRegistry()
     assert "(0 bindings)" in repr(reg)
 
 
+def test_keybinding_dispose_twice() -> None:
+    reg = KeyBindingsRegistry()
+    unregistered: list = []
+    reg.unregistered.connect(lambda *args: unregistered.append(args))
+    dispose = reg.register_keybinding_rule("cmd", KeyBindingRule(primary=KeyCode.KeyA))
+    dispose_keymap = reg.load_keymap([{"key": "B", "command": "cmd"}])
+    assert dispose and reg.is_bound(KeyCode.KeyA)
+
+    for _ in range(2):
+        dispose()
+        dispose_keymap()
+    assert len(reg) == 0
+    assert not reg.is_bound(KeyCode.KeyA)
+    assert not reg.is_bound(KeyCode.KeyB)
+    assert len(unregistered) == 2
+
+
+def test_keybinding_dispatcher(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app_model.registries import _keybindings_reg
+
+    reg = KeyBindingsRegistry()
+    ctrl_k = KeyMod.CtrlCmd | KeyCode.KeyK
+    ctrl_c = KeyMod.CtrlCmd | KeyCode.KeyC
+    reg.register_keybinding_rule("save", KeyBindingRule(primary=ctrl_c))
+    dispose = reg.register_keybinding_rule(
+        "comment", KeyBindingRule(primary=KeyChord(ctrl_k, ctrl_c), when="editing")
+    )
+    assert reg.is_chord_prefix(ctrl_k)
+    assert not reg.is_chord_prefix(ctrl_c)
+    assert not reg.is_chord_prefix(ctrl_k, {"editing": False})
+
+    dispatcher = KeyBindingDispatcher(reg)
+    ctx = {"editing": True}
+    kb = dispatcher.dispatch(ctrl_c, ctx)
+    assert kb and kb.command_id == "save"
+    assert dispatcher.dispatch(ctrl_k, ctx) is KeyBindingDispatcher.PENDING
+    assert dispatcher.pending == ctrl_k
+    # bare modifiers don't interrupt a pending chord
+    ctrl = KeyMod.CtrlCmd | KeyCode.Ctrl
+    assert dispatcher.dispatch(ctrl, ctx) is KeyBindingDispatcher.PENDING
+    assert dispatcher.pending == ctrl_k
+    kb = dispatcher.dispatch(ctrl_c, ctx)
+    assert kb and kb.command_id == "comment"
+    assert dispatcher.pending is None
+
+    # unbound second part is consumed
+    dispatcher.dispatch(ctrl_k, ctx)
+    assert dispatcher.dispatch(KeyCode.KeyX, ctx) is None
+    assert dispatcher.pending is None
+
+    # chords disabled in context are not started
+    assert dispatcher.dispatch(ctrl_k, {"editing": False}) is None
+
+    # pending chords time out (default timeout: 5 seconds)
+    now = 100.0
+    monkeypatch.setattr(_keybindings_reg, "monotonic", lambda: now)
+    assert dispatcher.dispatch(ctrl_k, ctx) is KeyBindingDispatcher.PENDING
+    now += 4
+    kb = dispatcher.dispatch(ctrl_c, ctx)
+    assert kb and kb.command_id == "comment"
+    assert dispatcher.dispatch(ctrl_k, ctx) is KeyBindingDispatcher.PENDING
+    now += 10
+    # the second part of a timed out chord is dispatched on its own
+    kb = dispatcher.dispatch(ctrl_c, ctx)
+    assert kb and kb.command_id == "save"
+    assert dispatcher.dispatch(ctrl_k, ctx) is KeyBindingDispatcher.PENDING
+    now += 10
+    assert dispatcher.pending is None
+
+    # chords never time out without a timeout
+    dispatcher.chord_timeout = None
+    dispatcher.dispatch(ctrl_k, ctx)
+    now += 1000
+    assert dispatcher.pending == ctrl_k
+    kb = dispatcher.dispatch(ctrl_c, ctx)
+    assert kb and kb.command_id == "comment"
+
+    dispose()
+    assert not reg.is_chord_prefix(ctrl_k)
+    assert not reg._chord_prefixes
+
+
+def test_keybinding_table() -> None:
+    from app_model.expressions import Context
+
+    reg = KeyBindingsRegistry()
+    ctx = Context({"editing": False, "other": 1})
+    reg.register_keybinding_rule("copy", KeyBindingRule(primary=KeyCode.KeyC))
+    reg.register_keybinding_rule(
+        "edit.copy",
+        KeyBindingRule(primary=KeyCode.KeyC, when="editing", weight=10),
+    )
+    table = reg.create_table(ctx)
+    assert table[KeyCode.KeyC].command_id == "copy"
+    assert KeyCode.KeyV not in table
+    assert table.get(KeyCode.KeyV) is None
+
+    ctx["editing"] = True
+    assert table[KeyCode.KeyC].command_id == "edit.copy"
+    dispose = reg.register_keybinding_rule(
+        "paste", KeyBindingRule(primary=KeyCode.KeyV)
+    )
+    assert table.get(KeyCode.KeyV).command_id == "paste"
+    dispose()
+    assert len(table) == 1
+    assert list(table) == [KeyCode.KeyC]
+
+    # only keys using changed names are re-resolved
+    calls: list[int] = []
+    table._resolve = calls.append  # type: ignore [method-assign]
+    ctx["other"] = 2
+    assert not calls
+    ctx["editing"] = False
+    assert calls == [KeyCode.KeyC]
+
+
+def test_keybinding_conflicts() -> None:
+    reg = KeyBindingsRegistry()
+    ctrl_k = KeyMod.CtrlCmd | KeyCode.KeyK
+    assert reg.get_conflicts() == []
+
+    def _conflicts() -> list:
+        return [
+            (c.kind, [b.command_id for b in c.bindings]) for c in reg.get_conflicts()
+        ]
+
+    # an unconditional binding always wins over later ones with the same priority
+    a = reg.register_keybinding_rule("a", KeyBindingRule(primary=ctrl_k))
+    reg.register_keybinding_rule("b", KeyBindingRule(primary=ctrl_k, when="x"))
+    assert _conflicts() == [("shadowed", ["a", "b"])]
+    # ... but only the order of registration decides between equal bindings
+    a2 = reg.register_keybinding_rule("a2", KeyBindingRule(primary=ctrl_k))
+    assert _conflicts() == [("ambiguous", ["a", "a2"]), ("shadowed", ["a", "b"])]
+    assert a and a2
+    a()
+    # the conditional binding runs whenever its condition is true
+    assert _conflicts() == [("ambiguous", ["b", "a2"])]
+    a2()
+    assert reg.get_conflicts() == []
+
+    # disjoint `when` names with the same priority may both be enabled
+    reg.register_keybinding_rule("c", KeyBindingRule(primary=ctrl_k, when="y"))
+    # but not necessarily if they share names
+    reg.register_keybinding_rule("d", KeyBindingRule(primary=ctrl_k, when="not x"))
+    conflicts = reg.get_conflicts()
+    assert {c.kind for c in conflicts} == {"ambiguous"}
+    pairs = {frozenset(b.command_id for b in c.bindings) for c in conflicts}
+    assert pairs == {frozenset("bc"), frozenset("cd")}
+
+    # conditions sharing names may still overlap, unless they are provably disjoint
+    ctrl_j = KeyMod.CtrlCmd | KeyCode.KeyJ
+    reg.register_keybinding_rule("gt", KeyBindingRule(primary=ctrl_j, when="n > 1"))
+    reg.register_keybinding_rule("lt", KeyBindingRule(primary=ctrl_j, when="n < 5"))
+    assert [c.kind for c in reg.get_conflicts(ctrl_j)] == ["ambiguous"]
+    reg.register_keybinding_rule("ge", KeyBindingRule(primary=ctrl_j, when="n >= 5"))
+    conflicts = reg.get_conflicts(ctrl_j)
+    pairs = {frozenset(b.command_id for b in c.bindings) for c in conflicts}
+    assert pairs == {frozenset(["gt", "lt"]), frozenset(["gt", "ge"])}
+    ctrl_l = KeyMod.CtrlCmd | KeyCode.KeyL
+    reg.register_keybinding_rule("one", KeyBindingRule(primary=ctrl_l, when="n == 1"))
+    reg.register_keybinding_rule(
+        "two", KeyBindingRule(primary=ctrl_l, when="n == 2 and x")
+    )
+    assert reg.get_conflicts(ctrl_l) == []
+
+    # higher priority binding that is always enabled shadows the others
+    reg.register_keybinding_rule("e", KeyBindingRule(primary=ctrl_k, weight=10))
+    (conflict,) = reg.get_conflicts(ctrl_k)
+    assert conflict.kind == "shadowed"
+    assert conflict.bindings[0].command_id == "e"
+    assert len(conflict.bindings) == 4
+
+    # chord prefix collision
+    reg.register_keybinding_rule(
+        "chord", KeyBindingRule(primary=KeyChord(ctrl_k, KeyCode.KeyC))
+    )
+    kinds = [c.kind for c in reg.get_conflicts(ctrl_k)]
+    assert kinds == ["shadowed", "chord_prefix"]
+    assert reg.get_conflicts(KeyCode.KeyC) == []
+
+
+def test_load_dump_keymap() -> None:
+    import io
+
+    reg = KeyBindingsRegistry()
+    reg.register_keybinding_rule("app.cmd", KeyBindingRule(primary=KeyCode.KeyA))
+    registered: list = []
+    reg.registered.connect(lambda *args: registered.append(args))
+
+    keymap = [
+        {"key": "Ctrl+K Ctrl+C", "command": "comment", "when": "editing"},
+        {"key": "Shift+B", "command": "b", "weight": 5, "source": "plugin"},
+    ]
+    dispose = reg.load_keymap(keymap)
+    keys = {KeyBinding.from_str(k["key"]).to_int() for k in keymap}
+    assert registered == [({"comment", "b"}, keys)]
+    assert len(reg) == 3
+    kb = reg.get_context_prioritized_keybinding(
+        KeyBinding.from_str("Ctrl+K Ctrl+C").to_int(), {"editing": True}
+    )
+    assert kb and kb.command_id == "comment"
+    assert kb.source == KeyBindingSource.USER
+
+    stream = io.StringIO()
+    text = reg.dump_keymap(KeyBindingSource.USER, stream)
+    assert stream.getvalue() == text
+    assert json.loads(text) == [
+        {
+            "key": "Ctrl+K Ctrl+C",
+            "command": "comment",
+            "when": "editing",
+            "source": "user",
+        }
+    ]
+    unregistered: list = []
+    reg.unregistered.connect(lambda *args: unregistered.append(args))
+    dispose()
+    assert len(reg) == 1
+    assert unregistered == registered
+
+    # round trip
+    dispose = reg.load_keymap(io.StringIO(reg.dump_keymap()))
+    assert len(reg) == 2
+    dispose()
+
+    # all entries are validated before registering anything
+    bad = json.dumps(
+        [
+            {"key": "Ctrl+A", "command": "ok"},
+            {"key": "Ctrl+Foo", "command": "x"},
+            {"command": "x"},
+            {"key": "A", "command": "x", "when": "a +"},
+        ]
+    )
+    with pytest.raises(ValueError, match=r"(?s)entry 1.*entry 2.*entry 3"):
+        reg.load_keymap(bad)
+    assert len(reg) == 1
+    assert len(registered) == 2  # once per successful load
+
+
+def test_keybinding_layers() -> None:
+    reg = KeyBindingsRegistry()
+    reg.register_keybinding_rule("insert_j", KeyBindingRule(primary=KeyCode.KeyJ))
+    reg.register_keybinding_rule(
+        "down", KeyBindingRule(primary=KeyCode.KeyJ), layer="normal"
+    )
+    dispose = reg.load_keymap(
+        [{"key": "J", "command": "visual_down", "layer": "visual", "when": "sel"}]
+    )
+    table = reg.create_table({"sel": True})
+    changes: list = []
+    reg.layers_changed.connect(changes.append)
+    unregistered = []
+    reg.unregistered.connect(lambda: unregistered.append(1))
+
+    def _resolve() -> str | None:
+        kb = reg.get_context_prioritized_keybinding(KeyCode.KeyJ, {"sel": False})
+        return kb.command_id if kb else None
+
+    assert len(reg) == 3
+    assert _resolve() == "insert_j"
+    assert reg.get_keybinding("down") is None  # layer is not active
+    assert table[KeyCode.KeyJ].command_id == "insert_j"
+
+    reg.push_layer("normal")
+    assert _resolve() == "down"
+    assert reg.get_keybinding("down")
+    assert table[KeyCode.KeyJ].command_id == "down"
+    reg.push_layer("visual")
+    assert _resolve() == "down"  # visual binding is disabled by context
+    assert table[KeyCode.KeyJ].command_id == "visual_down"
+    assert reg.active_layers == ("normal", "visual")
+    with pytest.raises(ValueError, match="already active"):
+        reg.push_layer("normal")
+
+    assert reg.pop_layer("normal") == "normal"
+    assert reg.pop_layer() == "visual"
+    assert _resolve() == "insert_j"
+    assert changes == [("normal",), ("normal", "visual"), ("visual",), ()]
+    with pytest.raises(ValueError, match="No active"):
+        reg.pop_layer()
+    with pytest.raises(ValueError, match="not active"):
+        reg.pop_layer("normal")
+    # switching layers doesn't (un)register anything
+    assert not unregistered
+
+    assert json.loads(reg.dump_keymap(KeyBindingSource.USER))[0]["layer"] == "visual"
+    dispose()
+    assert len(reg) == 2
+
+
 def test_register_keybinding_rule_filter_type() -> None:
     """Check `_filter_keybinding` type checking when setting."""
     reg = KeyBindingsRegistry()
@@ -170,6 +656,30 @@ def test_register_action_keybindings_prioritization(
     assert keybinding is None
 
 
+def test_register_action_keybindings_enablement() -> None:
+    reg = KeyBindingsRegistry()
+    action = Action(
+        id="cmd",
+        title="title",
+        callback=_noop,
+        enablement="enabled",
+        keybindings=[
+            {"primary": KeyCode.KeyA},
+            {"primary": KeyCode.KeyB},
+            {"primary": KeyCode.KeyC, "when": "editing"},
+        ],
+    )
+    reg.register_action_keybindings(action)
+    a, b, c = (
+        reg.get_context_prioritized_keybinding(k, {"enabled": True, "editing": True})
+        for k in (KeyCode.KeyA, KeyCode.KeyB, KeyCode.KeyC)
+    )
+    assert a and b and c
+    assert a.when is b.when is action.enablement
+    assert c.when._names == {"enabled", "editing"}
+    assert not reg.get_context_prioritized_keybinding(KeyCode.KeyA, {"enabled": False})
+
+
 @pytest.mark.parametrize(
     "kb1, kb2, gt, lt, eq",
     [
@@ -1,7 +1,7 @@
 import pytest
 from pydantic import ValidationError
 
-from app_model.types import Action, Icon
+from app_model.types import Action, CommandRule, Icon
 
 
 def test_icon_validate() -> None:
@@ -19,3 +19,33 @@ def test_action_validation() -> None:
 
     with pytest.raises(ValidationError, match=r"'x\.\<locals\>\:asdf' is not a valid"):
         Action(id="test", title="test", callback="x.<locals>:asdf")
+
+
+def test_command_rule_cached() -> None:
+    action = Action(id="test", title="test", callback=lambda: None)
+    rule = action._as_command_rule()
+    assert rule is action._as_command_rule()
+    assert type(rule) is CommandRule
+    assert rule._as_command_rule() is rule
+    assert rule == CommandRule(id="test", title="test")
+    assert hash(rule) == hash(CommandRule(id="test", title="test"))
+    # cached values are not carried over to modified copies
+    copy = rule.model_copy(update={"title": "other"})
+    assert hash(copy) != hash(rule)
+    assert action.model_copy(update={"title": "x"})._as_command_rule().title == "x"
+
+
+def test_equal_command_rules() -> None:
+    from app_model.registries import MenusRegistry
+
+    rule1 = CommandRule(id="a", title="A")
+    rule2 = CommandRule(id="a", title="A")
+    assert rule1._as_command_rule() is rule1
+    hash(rule1)
+    assert rule1 == rule2
+    assert rule2 == rule1
+
+    menus = MenusRegistry()
+    menus.append_menu_items([("file", {"command": {"id": "a", "title": "A"}})])
+    menus.append_menu_items([("file", {"command": {"id": "a", "title": "A"}})])
+    assert len(menus.get_menu("file")) == 1